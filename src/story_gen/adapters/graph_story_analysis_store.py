@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -77,7 +76,7 @@ class GraphStoryAnalysisStore:
             schema_version=result.document.schema_version,
             analyzed_at_utc=datetime.now(UTC).isoformat(),
         )
-        dashboard = asdict(result.dashboard)
+        dashboard = result.dashboard.to_dict()
         record = {
             "run_id": run.run_id,
             "story_id": run.story_id,
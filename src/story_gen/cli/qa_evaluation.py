@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
 from pathlib import Path
 
 from story_gen.core.pipeline_evaluation import evaluate_fixture_suite, load_fixture_suite
 
 DEFAULT_FIXTURES_PATH = Path("tests/fixtures/story_pipeline_eval_fixtures.v1.json")
 DEFAULT_OUTPUT_PATH = Path("work/qa/evaluation_summary.json")
+_ENCODER = json.JSONEncoder(indent=2)
+# The summary is written as bytes, so newline translation that text mode
+# used to do is applied here to keep platform line endings.
+_NEWLINE = os.linesep
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -20,17 +26,38 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES_PATH))
     parser.add_argument("--output", default=str(DEFAULT_OUTPUT_PATH))
     parser.add_argument("--strict", action="store_true")
+    parser.add_argument("--fail-fast", action="store_true")
     return parser
 
 
-def run_evaluation(*, fixtures_path: Path, output_path: Path, strict: bool) -> dict[str, object]:
-    """Execute fixture harness and write one JSON summary artifact."""
+def _encode_text(text: str) -> bytes:
+    """Encode text as UTF-8 with platform line endings, as text-mode files write it."""
+    if _NEWLINE != "\n":
+        text = text.replace("\n", _NEWLINE)
+    return text.encode("utf-8")
+
+
+def _evaluate_and_write(
+    *, fixtures_path: Path, output_path: Path, strict: bool, fail_fast: bool = False
+) -> tuple[dict[str, object], str]:
+    """Run the harness and return the summary with its serialized JSON text."""
     suite = load_fixture_suite(fixtures_path)
-    summary = evaluate_fixture_suite(suite=suite)
+    summary = evaluate_fixture_suite(suite=suite, fail_fast=fail_fast)
+    text = _ENCODER.encode(summary)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    output_path.write_bytes(_encode_text(text + "\n"))
     if strict and summary["status"] != "passed":
         raise SystemExit(1)
+    return summary, text
+
+
+def run_evaluation(
+    *, fixtures_path: Path, output_path: Path, strict: bool, fail_fast: bool = False
+) -> dict[str, object]:
+    """Execute fixture harness and write one JSON summary artifact."""
+    summary, _ = _evaluate_and_write(
+        fixtures_path=fixtures_path, output_path=output_path, strict=strict, fail_fast=fail_fast
+    )
     return summary
 
 
@@ -38,12 +65,23 @@ def main(argv: list[str] | None = None) -> None:
     """CLI entrypoint for QA fixture evaluation."""
     parser = build_arg_parser()
     parsed = parser.parse_args(argv)
-    summary = run_evaluation(
+    _, text = _evaluate_and_write(
         fixtures_path=Path(str(parsed.fixtures)),
         output_path=Path(str(parsed.output)),
         strict=bool(parsed.strict),
+        fail_fast=bool(parsed.fail_fast),
     )
-    print(json.dumps(summary, indent=2))
+    # The artifact and terminal output are identical, so serialize only once.
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or stream.isatty():
+        print(text)
+        return
+    # Redirected output (CI logs, files) skips print's text-layer re-encoding;
+    # flush pending text first so earlier writes keep their order.
+    stream.flush()
+    buffer.write(_encode_text(text + "\n"))
+    buffer.flush()
 
 
 if __name__ == "__main__":
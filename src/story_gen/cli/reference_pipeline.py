@@ -21,7 +21,7 @@ from typing import Literal, Mapping, NotRequired, Protocol, TypedDict
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
 DEFAULT_BASE_URL = "https://ncode.syosetu.com/n2267be/"
@@ -32,6 +32,24 @@ DEFAULT_TRANSLATE_CHUNK_SIZE = 1200
 DEFAULT_TRANSLATE_MAX_RETRIES = 5
 
 
+def _class_strainer(*classes: str) -> SoupStrainer:
+    """Only build tree nodes for elements carrying one of the given classes.
+
+    Subtrees under a matching element are kept intact, so selectors that
+    start from those elements behave exactly as on the full document.
+    """
+    wanted = frozenset(classes)
+
+    def _matches(value: str | None) -> bool:
+        return value is not None and not wanted.isdisjoint(value.split())
+
+    return SoupStrainer(class_=_matches)
+
+
+_INDEX_PAGE_STRAINER = _class_strainer("c-pager__item--last", "p-eplist")
+_EPISODE_PAGE_STRAINER = _class_strainer("p-novel__title", "p-novel__number", "js-novel-text")
+
+
 @dataclass(frozen=True)
 class EpisodeMeta:
     """Metadata discovered from the table-of-contents pages."""
@@ -262,7 +280,7 @@ def _parse_revised_timestamp(raw_title: str | None) -> str | None:
 
 def parse_index_page(html: str, base_url: str) -> tuple[list[EpisodeMeta], int]:
     """Parse one syosetu index page into episode metadata."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "html.parser", parse_only=_INDEX_PAGE_STRAINER)
 
     last_page = 1
     last_link = soup.select_one("a.c-pager__item--last")
@@ -329,7 +347,7 @@ def parse_index_page(html: str, base_url: str) -> tuple[list[EpisodeMeta], int]:
 
 def parse_episode_page(html: str) -> tuple[str, str, int | None]:
     """Extract chapter title, body text, and total-episodes hint."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "html.parser", parse_only=_EPISODE_PAGE_STRAINER)
     title_tag = soup.select_one("h1.p-novel__title")
     title_jp = title_tag.get_text(" ", strip=True) if isinstance(title_tag, Tag) else ""
 
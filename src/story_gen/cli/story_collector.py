@@ -3,28 +3,42 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import json
+import math
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import islice
+from json.encoder import encode_basestring
 from pathlib import Path
 from typing import TypedDict
 
 import httpx
 
-from story_gen.cli.reference_pipeline import parse_episode_page, parse_index_page
+from story_gen.cli.reference_pipeline import EpisodeMeta, parse_episode_page, parse_index_page
 from story_gen.pipelines.results import StoryCollectionResult
 
+_MAX_INDEX_PAGE_WORKERS = 4
+_FULL_STORY_BUFFER_BYTES = 1 << 20
+_CHAPTER_WRITE_WORKERS = 4
+# Output files are written as bytes, so newline translation that text mode
+# used to do is applied here to keep platform line endings.
+_NEWLINE = os.linesep
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ChapterLink:
     number: int
     title: str
     url: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CollectedChapter:
     number: int
     title: str
@@ -45,6 +59,7 @@ class StoryCollectorArgs:
     max_workers: int
     timeout_seconds: float
     user_agent: str
+    resume: bool = False
 
 
 class ChapterMetaPayload(TypedDict):
@@ -52,6 +67,7 @@ class ChapterMetaPayload(TypedDict):
     title: str
     url: str
     chars: int
+    bytes: int
 
 
 class CollectionPayload(TypedDict):
@@ -63,6 +79,32 @@ class CollectionPayload(TypedDict):
     chapters: list[ChapterMetaPayload]
 
 
+def _encode_collection_payload(payload: CollectionPayload) -> str:
+    """Render the index exactly as json.dumps(ensure_ascii=False, indent=2) would.
+
+    The schema is fixed, so emitting it directly skips the pure-Python indent
+    encoder's per-value dispatch; strings still use json's C string escaper.
+    """
+    quote = encode_basestring
+    rows = [
+        f'    {{\n      "number": {chapter["number"]},\n'
+        f'      "title": {quote(chapter["title"])},\n'
+        f'      "url": {quote(chapter["url"])},\n'
+        f'      "chars": {chapter["chars"]},\n'
+        f'      "bytes": {chapter["bytes"]}\n    }}'
+        for chapter in payload["chapters"]
+    ]
+    chapters = "[\n" + ",\n".join(rows) + "\n  ]" if rows else "[]"
+    return (
+        f'{{\n  "base_url": {quote(payload["base_url"])},\n'
+        f'  "series_code": {quote(payload["series_code"])},\n'
+        f'  "fetched_at_utc": {quote(payload["fetched_at_utc"])},\n'
+        f'  "chapter_count": {payload["chapter_count"]},\n'
+        f'  "output_file": {quote(payload["output_file"])},\n'
+        f'  "chapters": {chapters}\n}}'
+    )
+
+
 def _series_root(base_url: str, series_code: str) -> str:
     """Build the canonical series root URL from user inputs."""
     return f"{base_url.rstrip('/')}/{series_code.strip('/').lower()}/"
@@ -70,10 +112,31 @@ def _series_root(base_url: str, series_code: str) -> str:
 
 def _index_page_url(base_url: str, series_code: str, page: int) -> str:
     """Return the paginated TOC URL for a given series page."""
-    root = _series_root(base_url, series_code)
-    if page <= 1:
-        return root
-    return f"{root}?p={page}"
+    return _root_page_url(_series_root(base_url, series_code), page)
+
+
+def _root_page_url(root: str, page: int) -> str:
+    """Return the paginated TOC URL for an already-built series root."""
+    return root if page <= 1 else f"{root}?p={page}"
+
+
+class _CrawlPacer:
+    """Space serial request starts by crawl_delay_seconds on a monotonic clock.
+
+    Time already spent fetching, parsing, and writing counts toward the delay,
+    so slow responses are not followed by a full extra sleep.
+    """
+
+    def __init__(self, delay_seconds: float) -> None:
+        self._delay_seconds = delay_seconds
+        self._next_start: float | None = None
+
+    def wait(self) -> None:
+        if self._next_start is not None:
+            remaining = self._next_start - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+        self._next_start = time.monotonic() + self._delay_seconds
 
 
 def _fetch_text(client: httpx.Client, url: str) -> str:
@@ -81,58 +144,114 @@ def _fetch_text(client: httpx.Client, url: str) -> str:
     return client.get(url).text
 
 
+def _client_headers(user_agent: str) -> httpx.Headers:
+    """Build a fresh headers object for one client; clients never share it."""
+    return httpx.Headers({"User-Agent": user_agent})
+
+
+def _sync_client(args: StoryCollectorArgs) -> httpx.Client:
+    """Build the client used by serial runs and index discovery."""
+    return httpx.Client(
+        headers=_client_headers(args.user_agent),
+        timeout=args.timeout_seconds,
+        follow_redirects=True,
+    )
+
+
+def _async_client(args: StoryCollectorArgs) -> httpx.AsyncClient:
+    """Build the pooled async client used by parallel (max_workers > 1) runs."""
+    return httpx.AsyncClient(
+        headers=_client_headers(args.user_agent),
+        timeout=args.timeout_seconds,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=args.max_workers,
+            max_keepalive_connections=args.max_workers,
+        ),
+    )
+
+
+async def _fetch_index_pages_async(args: StoryCollectorArgs, page_urls: list[str]) -> list[str]:
+    """Fetch remaining index pages concurrently, returning HTML in page order."""
+    semaphore = asyncio.Semaphore(min(args.max_workers, _MAX_INDEX_PAGE_WORKERS))
+
+    async def _fetch(client: httpx.AsyncClient, url: str) -> str:
+        async with semaphore:
+            response = await client.get(url)
+        return response.text
+
+    async with _async_client(args) as client:
+        return await asyncio.gather(*(_fetch(client, url) for url in page_urls))
+
+
+def _add_index_episodes(all_links: dict[int, ChapterLink], episodes: list[EpisodeMeta]) -> None:
+    for episode in episodes:
+        all_links[episode.episode_number] = ChapterLink(
+            number=episode.episode_number,
+            title=episode.title_jp,
+            url=episode.url,
+        )
+
+
 def collect_chapter_links(args: StoryCollectorArgs) -> list[ChapterLink]:
     """Discover chapter links from the series index pages."""
-    headers = {"User-Agent": args.user_agent}
-    with httpx.Client(
-        headers=headers, timeout=args.timeout_seconds, follow_redirects=True
-    ) as client:
-        first_page_url = _index_page_url(args.base_url, args.series_code, 1)
+    all_links: dict[int, ChapterLink] = {}
+    with _sync_client(args) as client:
+        root = _series_root(args.base_url, args.series_code)
+        pacer = _CrawlPacer(args.crawl_delay_seconds)
+        first_page_url = root
+        pacer.wait()
         first_html = _fetch_text(client, first_page_url)
         first_page_episodes, last_page = parse_index_page(first_html, first_page_url)
-
-        all_links: dict[int, ChapterLink] = {}
-        for episode in first_page_episodes:
-            all_links[episode.episode_number] = ChapterLink(
-                number=episode.episode_number,
-                title=episode.title_jp,
-                url=episode.url,
-            )
+        _add_index_episodes(all_links, first_page_episodes)
 
         # Walk all remaining pages when the index advertises pagination.
-        for page in range(2, last_page + 1):
-            time.sleep(args.crawl_delay_seconds)
-            page_url = _index_page_url(args.base_url, args.series_code, page)
-            page_html = _fetch_text(client, page_url)
+        if args.max_workers <= 1:
+            for page in range(2, last_page + 1):
+                pacer.wait()
+                page_url = _root_page_url(root, page)
+                page_html = _fetch_text(client, page_url)
+                page_episodes, _ = parse_index_page(page_html, page_url)
+                _add_index_episodes(all_links, page_episodes)
+
+    if args.max_workers > 1 and last_page > 1:
+        # Parallel runs overlap page fetches like chapter fetches do; parsing
+        # stays in page order so later pages still win on duplicate numbers.
+        page_urls = [_root_page_url(root, page) for page in range(2, last_page + 1)]
+        page_htmls = asyncio.run(_fetch_index_pages_async(args, page_urls))
+        for page_url, page_html in zip(page_urls, page_htmls, strict=True):
             page_episodes, _ = parse_index_page(page_html, page_url)
-            for episode in page_episodes:
-                all_links[episode.episode_number] = ChapterLink(
-                    number=episode.episode_number,
-                    title=episode.title_jp,
-                    url=episode.url,
-                )
-
-    ordered = [all_links[number] for number in sorted(all_links)]
-    filtered: list[ChapterLink] = []
-    for link in ordered:
-        if link.number < args.chapter_start:
-            continue
-        if args.chapter_end is not None and link.number > args.chapter_end:
-            continue
-        filtered.append(link)
-    if args.max_chapters is not None:
-        filtered = filtered[: args.max_chapters]
-    return filtered
-
-
-def _fetch_chapter_once(link: ChapterLink, args: StoryCollectorArgs) -> CollectedChapter:
-    """Download and parse a single chapter page in one isolated client session."""
-    headers = {"User-Agent": args.user_agent}
-    with httpx.Client(
-        headers=headers, timeout=args.timeout_seconds, follow_redirects=True
-    ) as client:
-        html = _fetch_text(client, link.url)
-    return _chapter_from_html(link, html)
+            _add_index_episodes(all_links, page_episodes)
+
+    # One ordered pass applies the range and stops as soon as max_chapters is met.
+    chapter_end = args.chapter_end if args.chapter_end is not None else math.inf
+    in_range = (
+        all_links[number]
+        for number in sorted(all_links)
+        if args.chapter_start <= number <= chapter_end
+    )
+    return list(islice(in_range, args.max_chapters))
+
+
+async def _fetch_chapter_async(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, link: ChapterLink
+) -> CollectedChapter:
+    """Download and parse one chapter page while holding a concurrency slot."""
+    async with semaphore:
+        response = await client.get(link.url)
+    return _chapter_from_html(link, response.text)
+
+
+async def _collect_chapters_async(
+    args: StoryCollectorArgs, links: list[ChapterLink], sink: Callable[[CollectedChapter], None]
+) -> None:
+    """Fetch chapters concurrently on one event loop, bounded by max_workers."""
+    semaphore = asyncio.Semaphore(args.max_workers)
+    async with _async_client(args) as client:
+        for next_done in asyncio.as_completed(
+            [_fetch_chapter_async(client, semaphore, link) for link in links]
+        ):
+            sink(await next_done)
 
 
 def _chapter_from_html(link: ChapterLink, html: str) -> CollectedChapter:
@@ -147,100 +266,227 @@ def _chapter_from_html(link: ChapterLink, html: str) -> CollectedChapter:
     )
 
 
-def collect_chapters(args: StoryCollectorArgs, links: list[ChapterLink]) -> list[CollectedChapter]:
-    """Fetch chapter bodies either serially (respectful crawl) or in parallel."""
+def _stream_chapters(
+    args: StoryCollectorArgs, links: list[ChapterLink], sink: Callable[[CollectedChapter], None]
+) -> None:
+    """Hand each fetched chapter to sink as soon as it has been parsed."""
     if args.max_workers <= 1:
-        headers = {"User-Agent": args.user_agent}
-        chapters: list[CollectedChapter] = []
-        with httpx.Client(
-            headers=headers,
-            timeout=args.timeout_seconds,
-            follow_redirects=True,
-        ) as client:
-            for index, link in enumerate(links):
-                if index > 0:
-                    time.sleep(args.crawl_delay_seconds)
+        with _sync_client(args) as client:
+            pacer = _CrawlPacer(args.crawl_delay_seconds)
+            for link in links:
+                pacer.wait()
                 html = _fetch_text(client, link.url)
-                chapters.append(_chapter_from_html(link, html))
-        return chapters
-
-    by_number: dict[int, CollectedChapter] = {}
-    with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
-        # Preserve stable ordering even though futures complete out of order.
-        future_map = {
-            executor.submit(_fetch_chapter_once, link, args): link.number for link in links
-        }
-        for future in as_completed(future_map):
-            chapter = future.result()
-            by_number[chapter.number] = chapter
-    return [by_number[number] for number in sorted(by_number)]
-
-
-def _write_collection_outputs(
-    output_root: Path,
-    output_filename: str,
-    base_url: str,
-    series_code: str,
-    chapters: list[CollectedChapter],
-) -> StoryCollectionResult:
-    """Write full text, per-chapter files, and metadata index for one run."""
-    output_root.mkdir(parents=True, exist_ok=True)
-    chapters_dir = output_root / "chapters"
-    chapters_dir.mkdir(parents=True, exist_ok=True)
-
-    full_story_path = output_root / output_filename
-    with full_story_path.open("w", encoding="utf-8") as handle:
-        for chapter in chapters:
-            handle.write(f"===== Chapter {chapter.number}: {chapter.title} =====\n\n")
-            handle.write(chapter.body)
-            handle.write("\n\n\n")
-
-    for chapter in chapters:
-        chapter_file = chapters_dir / f"{chapter.number:04d}.txt"
-        chapter_file.write_text(chapter.body, encoding="utf-8")
-
-    payload: CollectionPayload = {
-        "base_url": base_url,
-        "series_code": series_code,
-        "fetched_at_utc": datetime.now(UTC).isoformat(),
-        "chapter_count": len(chapters),
-        "output_file": str(full_story_path),
-        "chapters": [
+                sink(_chapter_from_html(link, html))
+        return
+    asyncio.run(_collect_chapters_async(args, links, sink))
+
+
+def collect_chapters(args: StoryCollectorArgs, links: list[ChapterLink]) -> list[CollectedChapter]:
+    """Fetch chapter bodies either serially (respectful crawl) or in parallel."""
+    # Each chapter number gets a fixed output slot up front, so out-of-order
+    # completions are placed directly instead of being re-sorted afterwards.
+    numbers = sorted({link.number for link in links})
+    slot_by_number = {number: slot for slot, number in enumerate(numbers)}
+    slots: list[CollectedChapter | None] = [None] * len(numbers)
+
+    def _place(chapter: CollectedChapter) -> None:
+        slots[slot_by_number[chapter.number]] = chapter
+
+    _stream_chapters(args, links, _place)
+    return [chapter for chapter in slots if chapter is not None]
+
+
+def _encode_text(text: str) -> bytes:
+    """Encode text as UTF-8 with platform line endings, as text-mode files write it."""
+    if _NEWLINE != "\n":
+        text = text.replace("\n", _NEWLINE)
+    return text.encode("utf-8")
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temporary sibling and atomically swap it into place."""
+    temporary = path.with_name(f"{path.name}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+class _ChapterStreamWriter:
+    """Write chapters to disk as they arrive, keeping only metadata in memory."""
+
+    def __init__(
+        self,
+        *,
+        output_root: Path,
+        output_filename: str,
+        links: list[ChapterLink],
+        resumed_titles: dict[int, str] | None = None,
+    ) -> None:
+        self.output_root = output_root
+        self.chapters_dir = output_root / "chapters"
+        self.chapters_dir.mkdir(parents=True, exist_ok=True)
+        self.full_story_path = output_root / output_filename
+        # A large buffer lets many chapters coalesce into few write() syscalls.
+        # Stream into a sibling file and publish it with os.replace so readers
+        # never observe a half-written full story.
+        self._partial_path = self.full_story_path.with_name(f"{output_filename}.partial")
+        self._handle = self._partial_path.open("wb", buffering=_FULL_STORY_BUFFER_BYTES)
+        self._order = links
+        self._next_index = 0
+        self._pending: dict[int, tuple[CollectedChapter, bytes]] = {}
+        # Chapters kept from an earlier run are read back from disk only when
+        # their turn comes in the full story.
+        self._resumed_titles = resumed_titles or {}
+        self.chapters: list[ChapterMetaPayload] = []
+        # Per-chapter files are independent, so their writes overlap on a
+        # small I/O pool while the caller keeps fetching and appending. Each
+        # lands atomically so an interrupted run never leaves a truncated
+        # NNNN.txt behind for --resume to pick up.
+        self._file_writes = ThreadPoolExecutor(max_workers=_CHAPTER_WRITE_WORKERS)
+        self._file_futures: list[Future[None]] = []
+        self._flush_ready()
+
+    def add(self, chapter: CollectedChapter) -> None:
+        # Encode each body once and reuse the bytes for both output files.
+        encoded = _encode_text(chapter.body)
+        chapter_file = self.chapters_dir / f"{chapter.number:04d}.txt"
+        self._file_futures.append(
+            self._file_writes.submit(_write_bytes_atomic, chapter_file, encoded)
+        )
+        # Parallel fetches complete out of order; only chapters that arrive
+        # ahead of an earlier one wait here before joining the full story.
+        self._pending[chapter.number] = (chapter, encoded)
+        self._flush_ready()
+
+    def _flush_ready(self) -> None:
+        while self._next_index < len(self._order):
+            link = self._order[self._next_index]
+            ready = self._pending.pop(link.number, None)
+            if ready is not None:
+                chapter, encoded = ready
+                self._append(chapter.number, chapter.title, chapter.url, encoded, len(chapter.body))
+            elif link.number in self._resumed_titles:
+                encoded = (self.chapters_dir / f"{link.number:04d}.txt").read_bytes()
+                chars = len(encoded.decode("utf-8").replace(_NEWLINE, "\n"))
+                title = self._resumed_titles[link.number]
+                self._append(link.number, title, link.url, encoded, chars)
+            else:
+                break
+            self._next_index += 1
+
+    def _append(self, number: int, title: str, url: str, encoded: bytes, chars: int) -> None:
+        header = f"===== Chapter {number}: {title} =====\n\n"
+        self._handle.writelines((_encode_text(header), encoded, _encode_text("\n\n\n")))
+        self.chapters.append(
             {
-                "number": chapter.number,
-                "title": chapter.title,
-                "url": chapter.url,
-                "chars": len(chapter.body),
+                "number": number,
+                "title": title,
+                "url": url,
+                "chars": chars,
+                "bytes": len(encoded),
             }
-            for chapter in chapters
-        ],
+        )
+
+    def discard(self) -> None:
+        """Drop the unpublished full story after a failed run."""
+        self._partial_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self._handle.close()
+        self._file_writes.shutdown(wait=True)
+        for future in self._file_futures:
+            future.result()
+
+    def write_index(self, *, base_url: str, series_code: str) -> StoryCollectionResult:
+        """Write the metadata index once every chapter has been streamed."""
+        payload: CollectionPayload = {
+            "base_url": base_url,
+            "series_code": series_code,
+            "fetched_at_utc": datetime.now(UTC).isoformat(),
+            "chapter_count": len(self.chapters),
+            "output_file": str(self.full_story_path),
+            "chapters": self.chapters,
+        }
+        os.replace(self._partial_path, self.full_story_path)
+        index_path = self.output_root / "index.json"
+        _write_bytes_atomic(index_path, _encode_text(_encode_collection_payload(payload) + "\n"))
+        return StoryCollectionResult(
+            output_root=self.output_root,
+            full_story_path=self.full_story_path,
+            index_path=index_path,
+            chapter_count=len(self.chapters),
+        )
+
+
+def _resumable_chapter_titles(output_root: Path, links: list[ChapterLink]) -> dict[int, str]:
+    """Map already-downloaded chapter numbers to titles from the previous index."""
+    chapters_dir = output_root / "chapters"
+    if not chapters_dir.is_dir():
+        return {}
+    with os.scandir(chapters_dir) as entries:
+        on_disk = {
+            int(entry.name[:-4]): entry.stat().st_size
+            for entry in entries
+            if entry.name.endswith(".txt") and entry.name[:-4].isdigit() and entry.is_file()
+        }
+    previous_titles: dict[int, str] = {}
+    previous_sizes: dict[int, int] = {}
+    try:
+        previous = json.loads((output_root / "index.json").read_bytes())
+    except (OSError, ValueError):
+        previous = {}
+    if isinstance(previous, dict) and isinstance(previous.get("chapters"), list):
+        for item in previous["chapters"]:
+            if isinstance(item, dict):
+                number, title = item.get("number"), item.get("title")
+                if isinstance(number, int) and isinstance(title, str):
+                    previous_titles[number] = title
+                size = item.get("bytes")
+                if isinstance(number, int) and isinstance(size, int):
+                    previous_sizes[number] = size
+    # A file whose size disagrees with the previous index is stale or
+    # truncated, so that chapter is fetched again.
+    return {
+        link.number: previous_titles.get(link.number) or link.title or f"Chapter {link.number}"
+        for link in links
+        if link.number in on_disk
+        and previous_sizes.get(link.number, on_disk[link.number]) == on_disk[link.number]
     }
-    index_path = output_root / "index.json"
-    index_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
-    return StoryCollectionResult(
-        output_root=output_root,
-        full_story_path=full_story_path,
-        index_path=index_path,
-        chapter_count=len(chapters),
-    )
 
 
 def run_story_collection(args: StoryCollectorArgs) -> StoryCollectionResult:
     """Execute full chapter collection from discovery to artifact export."""
     links = collect_chapter_links(args)
     print(f"[collect] discovered chapters: {len(links)}")
-    chapters = collect_chapters(args, links)
     output_root = Path(args.output_dir) / args.series_code
-    result = _write_collection_outputs(
+    resumed_titles = _resumable_chapter_titles(output_root, links) if args.resume else {}
+    if resumed_titles:
+        print(f"[collect] resuming: {len(resumed_titles)} chapters already on disk")
+    writer = _ChapterStreamWriter(
         output_root=output_root,
         output_filename=args.output_filename,
-        base_url=args.base_url,
-        series_code=args.series_code,
-        chapters=chapters,
+        links=links,
+        resumed_titles=resumed_titles,
     )
+    try:
+        _stream_chapters(
+            args, [link for link in links if link.number not in resumed_titles], writer.add
+        )
+    except BaseException:
+        # Surface the fetch error, not a secondary chapter-write failure, and
+        # always drop the unpublished full story.
+        try:
+            with contextlib.suppress(Exception):
+                writer.close()
+        finally:
+            writer.discard()
+        raise
+    try:
+        writer.close()
+        result = writer.write_index(base_url=args.base_url, series_code=args.series_code)
+    finally:
+        # A failed chapter write or index publish must not leave the partial
+        # full story behind; after a successful publish it is already gone.
+        writer.discard()
     print(f"[collect] wrote output to: {result.output_root}")
     return result
 
@@ -262,6 +508,7 @@ def build_arg_parser() -> argparse.ArgumentParser:
         "--user-agent",
         default="story_gen_collector/0.1 (respectful crawler; personal research use)",
     )
+    parser.add_argument("--resume", action="store_true")
     return parser
 
 
@@ -281,6 +528,7 @@ def _args_from_namespace(namespace: argparse.Namespace) -> StoryCollectorArgs:
         max_workers=max(1, int(namespace.max_workers)),
         timeout_seconds=max(1.0, float(namespace.timeout_seconds)),
         user_agent=str(namespace.user_agent),
+        resume=bool(namespace.resume),
     )
 
 
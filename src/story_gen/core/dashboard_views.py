@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import binascii
+import math
 import struct
 import zlib
 from dataclasses import dataclass
+from functools import lru_cache
 from html import escape
+from operator import attrgetter
 
 from story_gen.core.dialogue_extraction import DialogueExtractionDetails, extract_dialogue_details
 from story_gen.core.essence_extraction import (
@@ -24,7 +26,7 @@ from story_gen.core.theme_arc_tracking import ArcSignal, ConflictShift, EmotionS
 from story_gen.core.timeline_composer import TimelineConflict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DashboardOverviewCard:
     """Top-level dashboard summary card."""
 
@@ -37,7 +39,7 @@ class DashboardOverviewCard:
     themes_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimelineLaneView:
     """Timeline lane projection."""
 
@@ -45,7 +47,7 @@ class TimelineLaneView:
     items: list[dict[str, object]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeHeatmapCell:
     """Heatmap cell for one theme/stage pair."""
 
@@ -54,7 +56,7 @@ class ThemeHeatmapCell:
     intensity: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArcChartPoint:
     """Arc chart point for character/conflict/emotion panels."""
 
@@ -64,7 +66,7 @@ class ArcChartPoint:
     label: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DrilldownPanelView:
     """Drilldown projection for one selected id."""
 
@@ -75,7 +77,7 @@ class DrilldownPanelView:
     evidence_segment_ids: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphNode:
     """Graph node used by interactive graph views."""
 
@@ -87,7 +89,7 @@ class GraphNode:
     layout_y: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphEdge:
     """Graph edge used by interactive graph views."""
 
@@ -97,7 +99,7 @@ class GraphEdge:
     weight: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DashboardReadModel:
     """Composed dashboard projection returned by API layer."""
 
@@ -109,6 +111,74 @@ class DashboardReadModel:
     graph_nodes: list[GraphNode]
     graph_edges: list[GraphEdge]
 
+    def to_dict(self) -> dict[str, object]:
+        """Return the `asdict` payload without per-field reflection or deepcopy."""
+        overview = self.overview
+        return {
+            "overview": {
+                "title": overview.title,
+                "macro_thesis": overview.macro_thesis,
+                "confidence_floor": overview.confidence_floor,
+                "quality_passed": overview.quality_passed,
+                "events_count": overview.events_count,
+                "beats_count": overview.beats_count,
+                "themes_count": overview.themes_count,
+            },
+            "timeline_lanes": [
+                {"lane": lane.lane, "items": [_copy_timeline_item(item) for item in lane.items]}
+                for lane in self.timeline_lanes
+            ],
+            "theme_heatmap": [
+                {"theme": cell.theme, "stage": cell.stage, "intensity": cell.intensity}
+                for cell in self.theme_heatmap
+            ],
+            "arc_points": [
+                {
+                    "lane": point.lane,
+                    "stage": point.stage,
+                    "value": point.value,
+                    "label": point.label,
+                }
+                for point in self.arc_points
+            ],
+            "drilldown": {
+                key: {
+                    "item_id": panel.item_id,
+                    "item_type": panel.item_type,
+                    "title": panel.title,
+                    "content": panel.content,
+                    "evidence_segment_ids": list(panel.evidence_segment_ids),
+                }
+                for key, panel in self.drilldown.items()
+            },
+            "graph_nodes": [
+                {
+                    "id": node.id,
+                    "label": node.label,
+                    "group": node.group,
+                    "stage": node.stage,
+                    "layout_x": node.layout_x,
+                    "layout_y": node.layout_y,
+                }
+                for node in self.graph_nodes
+            ],
+            "graph_edges": [
+                {
+                    "source": edge.source,
+                    "target": edge.target,
+                    "relation": edge.relation,
+                    "weight": edge.weight,
+                }
+                for edge in self.graph_edges
+            ],
+        }
+
+
+def _copy_timeline_item(item: dict[str, object]) -> dict[str, object]:
+    # Items hold scalars plus the discrepancy flag list; copy the list so the
+    # payload never aliases the read model, as `asdict` guaranteed.
+    return {key: list(value) if isinstance(value, list) else value for key, value in item.items()}
+
 
 def build_dashboard_read_model(
     *,
@@ -163,36 +233,14 @@ def build_dashboard_read_model(
 
 def export_graph_svg(*, nodes: list[GraphNode], edges: list[GraphEdge]) -> str:
     """Export graph projection to deterministic SVG text."""
-    width = 900
-    height = 520
-    node_coords = _graph_node_positions(nodes=nodes, width=width, height=height)
-    circles: list[str] = []
-    labels: list[str] = []
+    return _GRAPH_SVG_OPEN + "\n".join(_graph_svg_lines(nodes=nodes, edges=edges)) + "</svg>"
 
-    for node in nodes:
-        x, y = node_coords[node.id]
-        circles.append(
-            f'<circle cx="{x}" cy="{y}" r="16" fill="#2E5E4E" stroke="#173629" stroke-width="2" />'
-        )
-        labels.append(
-            f'<text x="{x}" y="{y + 32}" text-anchor="middle" fill="#10231C" font-size="12">{escape(node.label)}</text>'
-        )
-
-    lines: list[str] = []
-    for edge in edges:
-        source = node_coords.get(edge.source)
-        target = node_coords.get(edge.target)
-        if source is None or target is None:
-            continue
-        lines.append(
-            f'<line x1="{source[0]}" y1="{source[1]}" x2="{target[0]}" y2="{target[1]}" stroke="#5C8B7A" stroke-width="1.5" />'
-        )
 
-    body = "\n".join(lines + circles + labels)
-    return (
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
-        f'viewBox="0 0 {width} {height}"><rect width="100%" height="100%" fill="#EEF5F2" />{body}</svg>'
-    )
+def export_graph_svg_length(*, nodes: list[GraphNode], edges: list[GraphEdge]) -> int:
+    """Return the length of `export_graph_svg` output without building the document."""
+    lines = _graph_svg_lines(nodes=nodes, edges=edges)
+    separators = max(len(lines) - 1, 0)
+    return len(_GRAPH_SVG_OPEN) + sum(map(len, lines)) + separators + len("</svg>")
 
 
 def export_graph_png(*, nodes: list[GraphNode], edges: list[GraphEdge]) -> bytes:
@@ -239,7 +287,24 @@ def export_graph_png(*, nodes: list[GraphNode], edges: list[GraphEdge]) -> bytes
             color=(0x17, 0x36, 0x29, 0xFF),
         )
 
-    return _encode_png(width=width, height=height, rgba=bytes(canvas))
+    return _encode_png(width=width, height=height, rgba=canvas)
+
+
+_TIMELINE_SVG_LEGEND = (
+    '<rect x="38" y="28" width="18" height="18" fill="#2E5E4E" />',
+    '<text x="64" y="42" fill="#163229" font-size="12">timestamp present</text>',
+    '<rect x="220" y="28" width="18" height="18" fill="#4A6E9B" />',
+    '<text x="246" y="42" fill="#163229" font-size="12">timestamp missing</text>',
+)
+_HEATMAP_SVG_LEGEND = (
+    '<text x="34" y="48" fill="#163229" font-size="12">Low</text>',
+    '<rect x="72" y="34" width="26" height="14" fill="#EEF5F2" stroke="#D9E7E1" />',
+    '<rect x="100" y="34" width="26" height="14" fill="#CBE2D8" stroke="#D9E7E1" />',
+    '<rect x="128" y="34" width="26" height="14" fill="#A4CFC0" stroke="#D9E7E1" />',
+    '<rect x="156" y="34" width="26" height="14" fill="#7AB9A5" stroke="#D9E7E1" />',
+    '<rect x="184" y="34" width="26" height="14" fill="#2E5E4E" stroke="#D9E7E1" />',
+    '<text x="218" y="48" fill="#163229" font-size="12">High</text>',
+)
 
 
 def export_timeline_svg(*, lanes: list[TimelineLaneView]) -> str:
@@ -259,7 +324,7 @@ def export_timeline_svg(*, lanes: list[TimelineLaneView]) -> str:
     for lane_index, lane in enumerate(lanes):
         y = 120 + lane_index * 140
         lane_labels.append(
-            f'<text x="38" y="{y + 6}" fill="#163229" font-size="15">{escape(lane.lane)}</text>'
+            f'<text x="38" y="{y + 6}" fill="#163229" font-size="15">{_escape_label(lane.lane)}</text>'
         )
         lane_rows.append(
             f'<line x1="210" y1="{y}" x2="{width - 40}" y2="{y}" stroke="#8BA49B" stroke-width="2" />'
@@ -274,20 +339,14 @@ def export_timeline_svg(*, lanes: list[TimelineLaneView]) -> str:
                 f'<circle cx="{x}" cy="{y}" r="9" fill="{fill}" stroke="#173629" stroke-width="2" />'
             )
             item_labels.append(
-                f'<text x="{x}" y="{y + 30}" text-anchor="middle" fill="#163229" font-size="12">{escape(label)}</text>'
+                f'<text x="{x}" y="{y + 30}" text-anchor="middle" fill="#163229" font-size="12">{_escape_label(label)}</text>'
             )
 
-    legend = [
-        '<rect x="38" y="28" width="18" height="18" fill="#2E5E4E" />',
-        '<text x="64" y="42" fill="#163229" font-size="12">timestamp present</text>',
-        '<rect x="220" y="28" width="18" height="18" fill="#4A6E9B" />',
-        '<text x="246" y="42" fill="#163229" font-size="12">timestamp missing</text>',
-    ]
     if not lanes:
         item_labels.append(
             '<text x="40" y="120" fill="#163229" font-size="14">No timeline lanes available.</text>'
         )
-    body = "\n".join(legend + lane_rows + lane_labels + markers + item_labels)
+    body = "\n".join([*_TIMELINE_SVG_LEGEND, *lane_rows, *lane_labels, *markers, *item_labels])
     return (
         f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
         f'viewBox="0 0 {width} {height}"><rect width="100%" height="100%" fill="#EEF5F2" />'
@@ -362,58 +421,70 @@ def export_timeline_png(*, lanes: list[TimelineLaneView]) -> bytes:
                     stroke_width=2,
                     color=(0x17, 0x36, 0x29, 0xFF),
                 )
-    return _encode_png(width=width, height=height, rgba=bytes(canvas))
+    return _encode_png(width=width, height=height, rgba=canvas)
+
+
+_HEATMAP_STAGES: tuple[StoryStage, ...] = ("setup", "escalation", "climax", "resolution")
+
+
+@dataclass(frozen=True, slots=True)
+class _HeatmapGrid:
+    """Sorted theme rows with clamped per-stage intensities, shared by both exporters."""
+
+    themes: list[str]
+    intensities: list[list[float]]
+    height: int
+
+
+def _project_heatmap(cells: list[ThemeHeatmapCell]) -> _HeatmapGrid:
+    # The last cell per (theme, stage) wins. Sorting the cells first, as the
+    # exporters used to, was stable and so never changed which one that was.
+    values = {(cell.theme, cell.stage): cell.intensity for cell in cells}
+    themes = sorted({theme for theme, _ in values})
+    return _HeatmapGrid(
+        themes=themes,
+        intensities=[
+            [max(0.0, min(1.0, values.get((theme, stage), 0.0))) for stage in _HEATMAP_STAGES]
+            for theme in themes
+        ],
+        height=220 + max(len(themes), 1) * 56,
+    )
 
 
 def export_theme_heatmap_svg(*, cells: list[ThemeHeatmapCell]) -> str:
     """Export theme heatmap cells to deterministic SVG text."""
-    ordered_cells = sorted(cells, key=lambda cell: (cell.theme, cell.stage))
-    themes = sorted({cell.theme for cell in ordered_cells})
-    stages: list[StoryStage] = ["setup", "escalation", "climax", "resolution"]
-
+    grid = _project_heatmap(cells)
+    themes = grid.themes
     width = 980
-    height = 220 + max(len(themes), 1) * 56
+    height = grid.height
     cell_width = 150
     cell_height = 42
     grid_start_x = 280
     grid_start_y = 110
-    values: dict[tuple[str, StoryStage], float] = {
-        (cell.theme, cell.stage): cell.intensity for cell in ordered_cells
-    }
 
     headers = [
         f'<text x="{grid_start_x + index * cell_width + 10}" y="92" fill="#163229" font-size="13">{stage}</text>'
-        for index, stage in enumerate(stages)
+        for index, stage in enumerate(_HEATMAP_STAGES)
     ]
     rows: list[str] = []
     labels: list[str] = []
-    for row_index, theme in enumerate(themes):
+    for row_index, (theme, row_intensities) in enumerate(zip(themes, grid.intensities)):
         y = grid_start_y + row_index * cell_height
         labels.append(
-            f'<text x="34" y="{y + 26}" fill="#163229" font-size="14">{escape(theme)}</text>'
+            f'<text x="34" y="{y + 26}" fill="#163229" font-size="14">{_escape_label(theme)}</text>'
         )
-        for col_index, stage in enumerate(stages):
+        for col_index, intensity in enumerate(row_intensities):
             x = grid_start_x + col_index * cell_width
-            intensity = max(0.0, min(1.0, values.get((theme, stage), 0.0)))
             fill = _rgb_hex(_heatmap_color(intensity))
             rows.append(
-                f'<rect x="{x}" y="{y}" width="{cell_width - 8}" height="{cell_height - 8}" fill="{fill}" stroke="#D9E7E1" stroke-width="1" />'
+                f'<rect x="{x}" y="{y}" width="{cell_width - 8}" height="{cell_height - 8}" fill="{fill}" stroke="#D9E7E1" />'
             )
 
-    legend = [
-        '<text x="34" y="48" fill="#163229" font-size="12">Low</text>',
-        '<rect x="72" y="34" width="26" height="14" fill="#EEF5F2" stroke="#D9E7E1" />',
-        '<rect x="100" y="34" width="26" height="14" fill="#CBE2D8" stroke="#D9E7E1" />',
-        '<rect x="128" y="34" width="26" height="14" fill="#A4CFC0" stroke="#D9E7E1" />',
-        '<rect x="156" y="34" width="26" height="14" fill="#7AB9A5" stroke="#D9E7E1" />',
-        '<rect x="184" y="34" width="26" height="14" fill="#2E5E4E" stroke="#D9E7E1" />',
-        '<text x="218" y="48" fill="#163229" font-size="12">High</text>',
-    ]
     if not themes:
         labels.append(
             '<text x="34" y="132" fill="#163229" font-size="14">No heatmap cells available.</text>'
         )
-    body = "\n".join(legend + headers + labels + rows)
+    body = "\n".join([*_HEATMAP_SVG_LEGEND, *headers, *labels, *rows])
     return (
         f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
         f'viewBox="0 0 {width} {height}"><rect width="100%" height="100%" fill="#F4F9F7" />'
@@ -423,18 +494,13 @@ def export_theme_heatmap_svg(*, cells: list[ThemeHeatmapCell]) -> str:
 
 def export_theme_heatmap_png(*, cells: list[ThemeHeatmapCell]) -> bytes:
     """Export theme heatmap cells to deterministic PNG bytes."""
-    ordered_cells = sorted(cells, key=lambda cell: (cell.theme, cell.stage))
-    themes = sorted({cell.theme for cell in ordered_cells})
-    stages: list[StoryStage] = ["setup", "escalation", "climax", "resolution"]
+    grid = _project_heatmap(cells)
     width = 980
-    height = 220 + max(len(themes), 1) * 56
+    height = grid.height
     cell_width = 150
     cell_height = 42
     grid_start_x = 280
     grid_start_y = 110
-    values: dict[tuple[str, StoryStage], float] = {
-        (cell.theme, cell.stage): cell.intensity for cell in ordered_cells
-    }
 
     canvas = bytearray(width * height * 4)
     _fill_canvas(canvas=canvas, width=width, height=height, color=(0xF4, 0xF9, 0xF7, 0xFF))
@@ -458,11 +524,10 @@ def export_theme_heatmap_png(*, cells: list[ThemeHeatmapCell]) -> bytes:
             color=color,
         )
 
-    for row_index, theme in enumerate(themes):
+    for row_index, row_intensities in enumerate(grid.intensities):
         y = grid_start_y + row_index * cell_height
-        for col_index, stage in enumerate(stages):
+        for col_index, intensity in enumerate(row_intensities):
             x = grid_start_x + col_index * cell_width
-            intensity = max(0.0, min(1.0, values.get((theme, stage), 0.0)))
             _draw_rect(
                 canvas=canvas,
                 width=width,
@@ -474,7 +539,39 @@ def export_theme_heatmap_png(*, cells: list[ThemeHeatmapCell]) -> bytes:
                 color=_heatmap_color(intensity),
             )
 
-    return _encode_png(width=width, height=height, rgba=bytes(canvas))
+    return _encode_png(width=width, height=height, rgba=canvas)
+
+
+@lru_cache(maxsize=1024)
+def _escape_label(label: str) -> str:
+    """Escape SVG text; stage, beat and character labels repeat across renders."""
+    return escape(label)
+
+
+_GRAPH_SVG_OPEN = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="900" height="520" '
+    'viewBox="0 0 900 520"><rect width="100%" height="100%" fill="#EEF5F2" />'
+)
+
+
+def _graph_svg_lines(*, nodes: list[GraphNode], edges: list[GraphEdge]) -> list[str]:
+    node_coords = _graph_node_positions(nodes=nodes, width=900, height=520)
+    lines = [
+        f'<line x1="{source[0]}" y1="{source[1]}" x2="{target[0]}" y2="{target[1]}" stroke="#5C8B7A" stroke-width="1.5" />'
+        for edge in edges
+        if (source := node_coords.get(edge.source)) is not None
+        and (target := node_coords.get(edge.target)) is not None
+    ]
+    placed = [(node_coords[node.id], node.label) for node in nodes]
+    lines.extend(
+        f'<circle cx="{x}" cy="{y}" r="16" fill="#2E5E4E" stroke="#173629" stroke-width="2" />'
+        for (x, y), _ in placed
+    )
+    lines.extend(
+        f'<text x="{x}" y="{y + 32}" text-anchor="middle" fill="#10231C" font-size="12">{_escape_label(label)}</text>'
+        for (x, y), label in placed
+    )
+    return lines
 
 
 def _graph_node_positions(
@@ -501,11 +598,18 @@ def _graph_node_positions(
 def _fill_canvas(
     *, canvas: bytearray, width: int, height: int, color: tuple[int, int, int, int]
 ) -> None:
-    pixel = bytes(color)
-    row = pixel * width
-    for y in range(height):
-        offset = y * width * 4
-        canvas[offset : offset + width * 4] = row
+    total = width * height * 4
+    if total == 0:
+        return
+    # Paint one row, then double the painted prefix until the canvas is full:
+    # O(log height) memmoves instead of one slice assignment per row.
+    pixels = memoryview(canvas)
+    filled = width * 4
+    pixels[:filled] = bytes(color) * width
+    while filled < total:
+        step = min(filled, total - filled)
+        pixels[filled : filled + step] = pixels[:step]
+        filled += step
 
 
 def _draw_rect(
@@ -519,16 +623,18 @@ def _draw_rect(
     rect_height: int,
     color: tuple[int, int, int, int],
 ) -> None:
-    for row in range(y, y + rect_height):
-        if not (0 <= row < height):
-            continue
-        start_x = max(0, x)
-        end_x = min(width, x + rect_width)
-        if start_x >= end_x:
-            continue
-        offset = (row * width + start_x) * 4
-        pixel_count = end_x - start_x
-        canvas[offset : offset + pixel_count * 4] = bytes(color) * pixel_count
+    start_x = max(0, x)
+    end_x = min(width, x + rect_width)
+    if start_x >= end_x:
+        return
+    # Clip once and reuse the span bytes; every row of the rect is identical.
+    span = bytes(color) * (end_x - start_x)
+    span_bytes = len(span)
+    row_bytes = width * 4
+    offset = start_x * 4
+    for row in range(max(0, y), min(height, y + rect_height)):
+        row_offset = row * row_bytes + offset
+        canvas[row_offset : row_offset + span_bytes] = span
 
 
 def _draw_line(
@@ -550,19 +656,11 @@ def _draw_line(
     err = dx - dy
     radius = max(0, thickness // 2)
 
-    while True:
-        for oy in range(-radius, radius + 1):
-            for ox in range(-radius, radius + 1):
-                _set_pixel(
-                    canvas=canvas,
-                    width=width,
-                    height=height,
-                    x=x0 + ox,
-                    y=y0 + oy,
-                    color=color,
-                )
-        if x0 == x1 and y0 == y1:
-            break
+    # Walk the Bresenham path once, recording the x extent it covers per row.
+    # y is monotone along the path, so rows arrive as consecutive runs.
+    runs: list[tuple[int, int, int]] = []
+    run_row, run_low, run_high = y0, x0, x0
+    while x0 != x1 or y0 != y1:
         twice = err * 2
         if twice > -dy:
             err -= dy
@@ -570,6 +668,32 @@ def _draw_line(
         if twice < dx:
             err += dx
             y0 += sy
+        if y0 != run_row:
+            runs.append((run_row, run_low, run_high))
+            run_row, run_low, run_high = y0, x0, x0
+        elif x0 < run_low:
+            run_low = x0
+        elif x0 > run_high:
+            run_high = x0
+    runs.append((run_row, run_low, run_high))
+    if sy < 0:
+        runs.reverse()
+
+    # The path moves in unit steps, so the square brush stamped along it covers
+    # one contiguous span per canvas row: paint each row exactly once.
+    pixel = bytes(color)
+    first_row = runs[0][0]
+    for row in range(max(0, first_row - radius), min(height, runs[-1][0] + radius + 1)):
+        nearby = runs[max(0, row - radius - first_row) : max(0, row + radius - first_row + 1)]
+        _fill_span(
+            canvas=canvas,
+            width=width,
+            height=height,
+            y=row,
+            x0=min(run[1] for run in nearby) - radius,
+            x1=max(run[2] for run in nearby) + radius,
+            pixel=pixel,
+        )
 
 
 def _draw_filled_circle(
@@ -583,12 +707,20 @@ def _draw_filled_circle(
 ) -> None:
     cx, cy = center
     radius_sq = radius * radius
+    pixel = bytes(color)
+    # Each row of a disc is one contiguous span, so fill it with a slice write.
     for y in range(cy - radius, cy + radius + 1):
-        for x in range(cx - radius, cx + radius + 1):
-            dx = x - cx
-            dy = y - cy
-            if dx * dx + dy * dy <= radius_sq:
-                _set_pixel(canvas=canvas, width=width, height=height, x=x, y=y, color=color)
+        dy = y - cy
+        reach = math.isqrt(radius_sq - dy * dy)
+        _fill_span(
+            canvas=canvas,
+            width=width,
+            height=height,
+            y=y,
+            x0=cx - reach,
+            x1=cx + reach,
+            pixel=pixel,
+        )
 
 
 def _draw_circle_stroke(
@@ -605,39 +737,68 @@ def _draw_circle_stroke(
     outer_sq = radius * radius
     inner_radius = max(0, radius - stroke_width)
     inner_sq = inner_radius * inner_radius
+    pixel = bytes(color)
+    # Each row of a ring is at most two spans either side of the inner hole.
     for y in range(cy - radius, cy + radius + 1):
-        for x in range(cx - radius, cx + radius + 1):
-            dx = x - cx
-            dy = y - cy
-            distance_sq = dx * dx + dy * dy
-            if inner_sq <= distance_sq <= outer_sq:
-                _set_pixel(canvas=canvas, width=width, height=height, x=x, y=y, color=color)
+        dy_sq = (y - cy) * (y - cy)
+        outer_reach = math.isqrt(outer_sq - dy_sq)
+        hole = inner_sq - dy_sq
+        if hole <= 0:
+            _fill_span(
+                canvas=canvas,
+                width=width,
+                height=height,
+                y=y,
+                x0=cx - outer_reach,
+                x1=cx + outer_reach,
+                pixel=pixel,
+            )
+            continue
+        inner_reach = math.isqrt(hole - 1)
+        _fill_span(
+            canvas=canvas,
+            width=width,
+            height=height,
+            y=y,
+            x0=cx - outer_reach,
+            x1=cx - inner_reach - 1,
+            pixel=pixel,
+        )
+        _fill_span(
+            canvas=canvas,
+            width=width,
+            height=height,
+            y=y,
+            x0=cx + inner_reach + 1,
+            x1=cx + outer_reach,
+            pixel=pixel,
+        )
 
 
-def _set_pixel(
-    *,
-    canvas: bytearray,
-    width: int,
-    height: int,
-    x: int,
-    y: int,
-    color: tuple[int, int, int, int],
+def _fill_span(
+    *, canvas: bytearray, width: int, height: int, y: int, x0: int, x1: int, pixel: bytes
 ) -> None:
-    if not (0 <= x < width and 0 <= y < height):
+    """Paint pixels x0..x1 (inclusive) of row y, clipped to the canvas."""
+    if not (0 <= y < height):
+        return
+    start_x = max(0, x0)
+    end_x = min(width - 1, x1)
+    if start_x > end_x:
         return
-    offset = (y * width + x) * 4
-    canvas[offset] = color[0]
-    canvas[offset + 1] = color[1]
-    canvas[offset + 2] = color[2]
-    canvas[offset + 3] = color[3]
+    offset = (y * width + start_x) * 4
+    count = end_x - start_x + 1
+    canvas[offset : offset + count * 4] = pixel * count
 
 
 def _png_chunk(tag: bytes, payload: bytes) -> bytes:
-    crc = binascii.crc32(tag + payload) & 0xFFFFFFFF
-    return struct.pack(">I", len(payload)) + tag + payload + struct.pack(">I", crc)
+    # Seed the payload CRC with the tag's instead of hashing a concatenated copy.
+    crc = zlib.crc32(payload, zlib.crc32(tag))
+    return b"".join((struct.pack(">I", len(payload)), tag, payload, struct.pack(">I", crc)))
 
 
+@lru_cache(maxsize=1024)
 def _heatmap_color(intensity: float) -> tuple[int, int, int, int]:
+    """Map intensity to the low-to-high gradient; theme strengths repeat at 3 decimals."""
     bounded = max(0.0, min(1.0, intensity))
     low = (0xEE, 0xF5, 0xF2)
     high = (0x2E, 0x5E, 0x4E)
@@ -657,25 +818,33 @@ def _rgb_hex(color: tuple[int, int, int, int]) -> str:
     return f"#{color[0]:02X}{color[1]:02X}{color[2]:02X}"
 
 
-def _encode_png(*, width: int, height: int, rgba: bytes) -> bytes:
+def _encode_png(*, width: int, height: int, rgba: bytes | bytearray) -> bytes:
     row_bytes = width * 4
     expected = row_bytes * height
     if len(rgba) != expected:
         raise ValueError(f"RGBA byte size mismatch: got {len(rgba)}, expected {expected}")
 
-    raw = bytearray()
+    # Each scanline is a filter-type 0 byte followed by the row. Feeding them
+    # straight from the canvas into one deflate stream never materializes the
+    # filtered image, and yields the same bytes as a one-shot compress.
+    pixels = memoryview(rgba)
+    compressor = zlib.compressobj(level=9)
+    compress = compressor.compress
+    deflated: list[bytes] = []
     for row in range(height):
-        raw.append(0)
         start = row * row_bytes
-        raw.extend(rgba[start : start + row_bytes])
+        deflated.append(compress(b"\x00"))
+        deflated.append(compress(pixels[start : start + row_bytes]))
+    deflated.append(compressor.flush())
 
     ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
-    compressed = zlib.compress(bytes(raw), level=9)
-    return (
-        b"\x89PNG\r\n\x1a\n"
-        + _png_chunk(b"IHDR", ihdr)
-        + _png_chunk(b"IDAT", compressed)
-        + _png_chunk(b"IEND", b"")
+    return b"".join(
+        (
+            b"\x89PNG\r\n\x1a\n",
+            _png_chunk(b"IHDR", ihdr),
+            _png_chunk(b"IDAT", b"".join(deflated)),
+            _png_chunk(b"IEND", b""),
+        )
     )
 
 
@@ -757,12 +926,13 @@ def _project_timeline_items(
     ]
 
 
+_THEME_SIGNAL_ORDER = attrgetter("label", "stage", "theme_id")
+
+
 def _build_theme_heatmap(themes: list[ThemeSignal]) -> list[ThemeHeatmapCell]:
     return [
         ThemeHeatmapCell(theme=signal.label, stage=signal.stage, intensity=signal.strength)
-        for signal in sorted(
-            themes, key=lambda signal: (signal.label, signal.stage, signal.theme_id)
-        )
+        for signal in sorted(themes, key=_THEME_SIGNAL_ORDER)
     ]
 
 
@@ -809,19 +979,19 @@ def _build_drilldown(
     extraction_details: DialogueExtractionDetails,
     essence_details: EssenceExtractionDetails,
 ) -> dict[str, DrilldownPanelView]:
-    output: dict[str, DrilldownPanelView] = {}
-    for insight in insights:
-        output[insight.insight_id] = DrilldownPanelView(
+    panels = [
+        DrilldownPanelView(
             item_id=insight.insight_id,
             item_type=f"insight:{insight.granularity}",
             title=insight.title,
             content=insight.content,
             evidence_segment_ids=insight.evidence_segment_ids,
         )
-    for theme in themes:
-        item_id = f"theme:{theme.theme_id}"
-        output[item_id] = DrilldownPanelView(
-            item_id=item_id,
+        for insight in insights
+    ]
+    panels.extend(
+        DrilldownPanelView(
+            item_id=f"theme:{theme.theme_id}",
             item_type="theme",
             title=f"Theme: {theme.label} ({theme.stage})",
             content=(
@@ -830,19 +1000,21 @@ def _build_drilldown(
             ),
             evidence_segment_ids=theme.evidence_segment_ids,
         )
-    for arc in arcs:
-        item_id = f"arc:{arc.entity_id}:{arc.stage}"
-        output[item_id] = DrilldownPanelView(
-            item_id=item_id,
+        for theme in themes
+    )
+    panels.extend(
+        DrilldownPanelView(
+            item_id=f"arc:{arc.entity_id}:{arc.stage}",
             item_type="arc",
             title=f"Character Arc: {arc.entity_name} ({arc.stage})",
             content=f"State {arc.state}; delta {arc.delta:+.2f}; confidence {arc.confidence:.2f}.",
             evidence_segment_ids=list(arc.evidence_segment_ids),
         )
-    for conflict in conflicts:
-        item_id = f"conflict:{conflict.from_state}:{conflict.to_state}"
-        output[item_id] = DrilldownPanelView(
-            item_id=item_id,
+        for arc in arcs
+    )
+    panels.extend(
+        DrilldownPanelView(
+            item_id=f"conflict:{conflict.from_state}:{conflict.to_state}",
             item_type="conflict",
             title=f"Conflict Shift: {conflict.from_state} -> {conflict.to_state}",
             content=(
@@ -851,15 +1023,20 @@ def _build_drilldown(
             ),
             evidence_segment_ids=list(conflict.evidence_segment_ids),
         )
-    for emotion in emotions:
-        item_id = f"emotion:{emotion.stage}"
-        output[item_id] = DrilldownPanelView(
-            item_id=item_id,
+        for conflict in conflicts
+    )
+    panels.extend(
+        DrilldownPanelView(
+            item_id=f"emotion:{emotion.stage}",
             item_type="emotion",
             title=f"Emotion: {emotion.stage}",
             content=f"Tone {emotion.tone}; score {emotion.score:.2f}; confidence {emotion.confidence:.2f}.",
             evidence_segment_ids=list(emotion.evidence_segment_ids),
         )
+        for emotion in emotions
+    )
+    # Later panels with a repeated id replace earlier ones in place, as before.
+    output = {panel.item_id: panel for panel in panels}
     _append_extraction_details(output=output, extraction_details=extraction_details)
     _append_essence_details(output=output, essence_details=essence_details)
     return output
@@ -1056,52 +1233,64 @@ def _build_graph(
     beat_segments: dict[str, set[str]] = {
         beat.beat_id: set(beat.evidence_segment_ids) for beat in document.story_beats
     }
+    # Index beats by segment so each theme only visits beats it actually shares
+    # evidence with, instead of intersecting against every beat.
+    beat_order = {beat_id: index for index, beat_id in enumerate(beat_segments)}
+    beats_by_segment: dict[str, list[str]] = {}
+    for beat_id, beat_segment_set in beat_segments.items():
+        for segment_id in beat_segment_set:
+            beats_by_segment.setdefault(segment_id, []).append(beat_id)
     for theme_id, theme_segment_set in theme_segments.items():
-        for beat_id, beat_segment_set in beat_segments.items():
-            overlap = theme_segment_set & beat_segment_set
-            if overlap:
-                # Weight based on normalized overlap: how much of the beat's evidence contains this theme.
-                weight = round(len(overlap) / max(len(beat_segment_set), 1) * 0.9 + 0.1, 2)
-                edges.append(
-                    GraphEdge(
-                        source=theme_id,
-                        target=beat_id,
-                        relation="expressed_in",
-                        weight=weight,
-                    )
+        overlap_counts: dict[str, int] = {}
+        for segment_id in theme_segment_set:
+            for beat_id in beats_by_segment.get(segment_id, ()):
+                overlap_counts[beat_id] = overlap_counts.get(beat_id, 0) + 1
+        for beat_id in sorted(overlap_counts, key=beat_order.__getitem__):
+            # Weight based on normalized overlap: how much of the beat's evidence contains this theme.
+            beat_evidence = max(len(beat_segments[beat_id]), 1)
+            weight = round(overlap_counts[beat_id] / beat_evidence * 0.9 + 0.1, 2)
+            edges.append(
+                GraphEdge(
+                    source=theme_id,
+                    target=beat_id,
+                    relation="expressed_in",
+                    weight=weight,
                 )
+            )
     return _layout_graph_nodes(nodes), edges
 
 
+_GRAPH_STAGE_COLUMN: dict[StoryStage | None, int] = {
+    "setup": 0,
+    "escalation": 1,
+    "climax": 2,
+    "resolution": 3,
+    None: 4,
+}
+_GRAPH_ROW_BASE = {
+    "theme": 80,
+    "beat": 220,
+    "character": 360,
+}
+
+
 def _layout_graph_nodes(nodes: list[GraphNode]) -> list[GraphNode]:
-    stage_column: dict[StoryStage, int] = {
-        "setup": 0,
-        "escalation": 1,
-        "climax": 2,
-        "resolution": 3,
-    }
-    row_base = {
-        "theme": 80,
-        "beat": 220,
-        "character": 360,
-    }
     slot_counts: dict[tuple[str, int], int] = {}
     positioned: list[GraphNode] = []
     for node in nodes:
-        column = stage_column[node.stage] if node.stage is not None else 4
+        column = _GRAPH_STAGE_COLUMN[node.stage]
         slot_key = (node.group, column)
         slot_index = slot_counts.get(slot_key, 0)
         slot_counts[slot_key] = slot_index + 1
-        x = 110 + column * 180 + ((slot_index % 3) - 1) * 34
-        y = row_base.get(node.group, 430) + (slot_index // 3) * 26
+        row, lane = divmod(slot_index, 3)
         positioned.append(
             GraphNode(
                 id=node.id,
                 label=node.label,
                 group=node.group,
                 stage=node.stage,
-                layout_x=x,
-                layout_y=y,
+                layout_x=110 + column * 180 + (lane - 1) * 34,
+                layout_y=_GRAPH_ROW_BASE.get(node.group, 430) + row * 26,
             )
         )
     return positioned
@@ -77,11 +77,14 @@ def registered_pipeline_stage_contracts() -> tuple[PipelineStageContract, ...]:
 
 
 def _assert_order(values: list[int], *, label: str) -> None:
+    for expected, value in enumerate(values, start=1):
+        if value != expected:
+            break
+    else:
+        return
     if values != sorted(values):
         raise ValueError(f"{label} must be sorted in ascending order.")
-    expected = list(range(1, len(values) + 1))
-    if values != expected:
-        raise ValueError(f"{label} must be a contiguous 1..N sequence.")
+    raise ValueError(f"{label} must be a contiguous 1..N sequence.")
 
 
 def validate_extraction_input(segments: list[RawSegment]) -> None:
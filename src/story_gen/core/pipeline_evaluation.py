@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from statistics import mean
 from typing import Any, Literal, cast
@@ -56,7 +57,15 @@ class EvaluationFixtureSuite:
 
 def load_fixture_suite(path: Path) -> EvaluationFixtureSuite:
     """Load and validate fixture suite JSON."""
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    stat = path.stat()
+    # Suites are immutable, so unchanged files are parsed once per process.
+    return _load_fixture_suite_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _load_fixture_suite_cached(path: str, mtime_ns: int, size: int) -> EvaluationFixtureSuite:
+    # json.loads detects UTF-8 from bytes, skipping a separate text decode pass.
+    raw = json.loads(Path(path).read_bytes())
     if not isinstance(raw, dict):
         raise ValueError("Fixture suite must be a JSON object.")
     fixture_version = _required_str(raw, "fixture_version")
@@ -84,11 +93,19 @@ def load_fixture_suite(path: Path) -> EvaluationFixtureSuite:
     )
 
 
-def evaluate_fixture_suite(*, suite: EvaluationFixtureSuite) -> dict[str, Any]:
-    """Run evaluation suite and return deterministic JSON-serializable summary."""
+def evaluate_fixture_suite(
+    *, suite: EvaluationFixtureSuite, fail_fast: bool = False
+) -> dict[str, Any]:
+    """Run evaluation suite and return deterministic JSON-serializable summary.
+
+    With ``fail_fast`` the remaining cases are skipped after the first failure.
+    """
     case_results: list[dict[str, Any]] = []
     for case in suite.cases:
-        case_results.append(_evaluate_case(case))
+        result = _evaluate_case(case)
+        case_results.append(result)
+        if fail_fast and result["status"] == "failed":
+            break
 
     calibration_summary = _evaluate_calibration(
         case_results=case_results,
@@ -122,6 +139,7 @@ def evaluate_fixture_suite(*, suite: EvaluationFixtureSuite) -> dict[str, Any]:
             "cases": len(case_results),
             "passed": len(case_results) - len(failed_cases),
             "failed": len(failed_cases),
+            "skipped": len(suite.cases) - len(case_results),
         },
         "confidence_distributions": {
             "alignment_quality": _distribution(all_alignment_scores),
@@ -230,7 +230,7 @@ def _build_records(*, result: StoryAnalysisResult) -> list[_RecordPayload]:
         _RecordPayload(
             name=_RECORD_DASHBOARD,
             media_type="application/json",
-            content=_stable_json_bytes(asdict(result.dashboard)),
+            content=_stable_json_bytes(result.dashboard.to_dict()),
         ),
         _RecordPayload(
             name=_RECORD_TIMELINE_ACTUAL,
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import io
+import json
 import os
 import runpy
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -41,6 +45,18 @@ def test_cli_app_main_prints_scaffold(capsys: pytest.CaptureFixture[str]) -> Non
     assert "concept dependencies:" in captured.out
 
 
+@pytest.mark.parametrize(
+    "module", [qa_evaluation, reference_pipeline, story_collector, youtube_downloader]
+)
+def test_build_arg_parser_returns_an_unshared_parser(module: Any) -> None:
+    first = module.build_arg_parser()
+    first.add_argument("--caller-only-flag")
+    second = module.build_arg_parser()
+    assert second is not first
+    with pytest.raises(SystemExit):
+        second.parse_args(["--caller-only-flag", "x"])
+
+
 def test_collect_main_builds_story_collector_args(monkeypatch: pytest.MonkeyPatch) -> None:
     seen: list[StoryCollectorArgs] = []
     monkeypatch.setattr(
@@ -134,6 +150,256 @@ def test_pipeline_canary_cli_reports_stage_successes(
     assert '"stage": "insights"' in captured.out
 
 
+def test_pipeline_canary_strips_transcript_markers_for_non_transcript_sources() -> None:
+    text_source = pipeline_canary._load_source(None, source_type="text")
+    assert "[" not in text_source and "]" not in text_source
+    assert "00:01 Narrator:" in text_source
+    assert pipeline_canary._load_source(None, source_type="transcript").startswith("[00:01]")
+
+
+def test_pipeline_canary_source_file_with_crlf_matches_default_source(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "canary.txt"
+    source.write_bytes(pipeline_canary.DEFAULT_SOURCE_TEXT.replace("\n", "\r\n").encode("utf-8"))
+    pipeline_canary.main(["--strict"])
+    default_payload = json.loads(capsys.readouterr().out)
+    pipeline_canary.main(["--strict", "--source-file", str(source)])
+    file_payload = json.loads(capsys.readouterr().out)
+    assert file_payload == default_payload
+
+
+def test_pipeline_canary_source_file_with_cr_only_matches_default_source(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "canary.txt"
+    source.write_bytes(pipeline_canary.DEFAULT_SOURCE_TEXT.replace("\n", "\r").encode("utf-8"))
+    assert pipeline_canary._load_source(str(source), source_type="transcript") == (
+        pipeline_canary.DEFAULT_SOURCE_TEXT
+    )
+    pipeline_canary.main(["--strict"])
+    default_payload = json.loads(capsys.readouterr().out)
+    pipeline_canary.main(["--strict", "--source-file", str(source)])
+    file_payload = json.loads(capsys.readouterr().out)
+    assert file_payload == default_payload
+
+    large = tmp_path / "large.txt"
+    large.write_bytes(("Title\r- Rhea enters the archive.\r\n" * 20_000).encode("utf-8"))
+    assert large.stat().st_size > 256 * 1024
+    loaded = pipeline_canary._load_source(str(large), source_type="document")
+    assert loaded == large.read_text(encoding="utf-8")
+    assert "\r" not in loaded
+
+
+def test_pipeline_canary_loads_large_and_empty_source_files(tmp_path: Path) -> None:
+    large = tmp_path / "large.txt"
+    large.write_bytes(("Rhea finds the ledger. \u00e9\n" * 20_000).encode("utf-8"))
+    assert large.stat().st_size > 256 * 1024
+    loaded = pipeline_canary._load_source(str(large), source_type="text")
+    assert loaded == large.read_bytes().decode("utf-8")
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert pipeline_canary._load_source(str(empty), source_type="text") == ""
+
+
+def test_pipeline_canary_writes_payload_to_text_only_streams(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stream)
+    pipeline_canary.main(["--strict"])
+    assert json.loads(stream.getvalue())["status"] == "ok"
+
+
+def test_pipeline_canary_keeps_platform_line_endings_when_redirected(
+    capsysbinary: pytest.CaptureFixture[bytes], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pipeline_canary, "_NEWLINE", "\r\n")
+    pipeline_canary.main(["--strict"])
+    out = capsysbinary.readouterr().out
+    assert out.endswith(b"}\r\n")
+    assert b"\n" not in out.replace(b"\r\n", b"")
+    assert json.loads(out)["status"] == "ok"
+
+
+def test_pipeline_canary_reports_timeline_failure_after_theme_tracking(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_timeline(**_: object) -> object:
+        raise ValueError("timeline exploded")
+
+    monkeypatch.setattr("story_gen.core.timeline_composer.compose_timeline", failing_timeline)
+    with pytest.raises(SystemExit):
+        pipeline_canary.main([])
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["failed_stage"] == "timeline"
+    assert payload["error"] == "timeline exploded"
+    assert [check["stage"] for check in payload["checks"]][-1] == "theme_tracking"
+
+
+def test_pipeline_canary_attributes_stage_contract_violations_to_the_stage(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_contract(beats: object) -> None:
+        raise ValueError("Beat records require evidence segments.")
+
+    monkeypatch.setattr("story_gen.core.narrative_analysis.validate_beat_output", failing_contract)
+    with pytest.raises(SystemExit):
+        pipeline_canary.main([])
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["failed_stage"] == "beat_detection"
+    assert payload["error"] == "Beat records require evidence segments."
+
+
+def test_pipeline_canary_reports_theme_failure_before_timeline(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_themes(**_: object) -> object:
+        raise ValueError("themes exploded")
+
+    monkeypatch.setattr("story_gen.core.theme_arc_tracking.track_theme_arc_signals", failing_themes)
+    with pytest.raises(SystemExit):
+        pipeline_canary.main([])
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["failed_stage"] == "theme_tracking"
+    assert "timeline" not in [check["stage"] for check in payload["checks"]]
+
+
+def test_pipeline_canary_translation_cache_reuses_identical_translations(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from story_gen.core import language_translation
+
+    calls: list[str] = []
+    original = language_translation.translate_segments
+
+    def counting_translate(**kwargs: Any) -> Any:
+        calls.append(str(kwargs["target_language"]))
+        return original(**kwargs)
+
+    monkeypatch.setattr(language_translation, "translate_segments", counting_translate)
+    monkeypatch.setattr(pipeline_canary, "_TRANSLATION_CACHE", OrderedDict())
+    runs = [
+        pipeline_canary.run_canary(
+            story_id="story-cache",
+            source_text=pipeline_canary.DEFAULT_SOURCE_TEXT,
+            source_type="transcript",
+            target_language=target_language,
+            strict=True,
+            translation_cache=True,
+        )
+        for target_language in ("en", "en", "es")
+    ]
+    assert calls == ["en", "es"]
+    assert runs[0] == runs[1]
+
+    pipeline_canary.run_canary(
+        story_id="story-cache",
+        source_text=pipeline_canary.DEFAULT_SOURCE_TEXT,
+        source_type="transcript",
+        target_language="en",
+        strict=True,
+    )
+    assert calls == ["en", "es", "en"]
+
+
+def test_pipeline_canary_batch_reports_one_result_per_manifest_entry(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "story.txt"
+    source.write_text(pipeline_canary.DEFAULT_SOURCE_TEXT, encoding="utf-8")
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        "\n".join(
+            [
+                json.dumps({"story_id": "batch-default"}),
+                "",
+                json.dumps({"story_id": "batch-file", "source_file": str(source)}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    pipeline_canary.main(["--strict", "--batch", str(manifest)])
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(str(result["story_id"]) for result in results) == [
+        "batch-default",
+        "batch-file",
+    ]
+    assert all(result["status"] == "ok" for result in results)
+
+
+def test_pipeline_canary_batch_reports_missing_source_and_fails(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        json.dumps({"story_id": "batch-missing", "source_file": str(tmp_path / "missing.txt")}),
+        encoding="utf-8",
+    )
+    with pytest.raises(SystemExit):
+        pipeline_canary.main(["--batch", str(manifest)])
+    result = json.loads(capsys.readouterr().out)
+    assert result["story_id"] == "batch-missing"
+    assert result["failed_stage"] == "source"
+
+
+def test_pipeline_canary_batch_keeps_reporting_after_an_entry_blows_up(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        "\n".join(
+            [
+                json.dumps({"story_id": "batch-ok"}),
+                # A NUL byte makes open() raise ValueError rather than OSError.
+                json.dumps({"story_id": "batch-broken", "source_file": "bad\u0000path.txt"}),
+                json.dumps({"story_id": "batch-ok-too"}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    with pytest.raises(SystemExit):
+        pipeline_canary.main(["--batch", str(manifest)])
+    results = {
+        str(result["story_id"]): result
+        for result in (json.loads(line) for line in capsys.readouterr().out.splitlines())
+    }
+    assert sorted(results) == ["batch-broken", "batch-ok", "batch-ok-too"]
+    assert results["batch-ok"]["status"] == "ok"
+    assert results["batch-ok-too"]["status"] == "ok"
+    assert results["batch-broken"]["status"] == "failed"
+    assert results["batch-broken"]["failed_stage"] == "source"
+
+
+def test_pipeline_canary_batch_job_reports_unexpected_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def exploding_canary(**_: object) -> dict[str, object]:
+        raise RuntimeError("canary exploded")
+
+    monkeypatch.setattr(pipeline_canary, "run_canary", exploding_canary)
+    result = pipeline_canary._run_batch_job(
+        pipeline_canary.CanaryJob(
+            story_id="batch-unexpected",
+            source_file=None,
+            source_type="transcript",
+            target_language="en",
+            strict=False,
+        )
+    )
+    assert result["story_id"] == "batch-unexpected"
+    assert result["failed_stage"] == "canary"
+    assert result["error"] == "canary exploded"
+
+
+def test_pipeline_canary_batch_rejects_malformed_manifest(tmp_path: Path) -> None:
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(json.dumps({"source_file": "story.txt"}), encoding="utf-8")
+    with pytest.raises(SystemExit, match="line 1 must be an object with story_id"):
+        pipeline_canary.main(["--batch", str(manifest)])
+
+
 def test_qa_evaluation_cli_reports_status(
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
@@ -145,6 +411,20 @@ def test_qa_evaluation_cli_reports_status(
     assert output.exists()
 
 
+def test_qa_evaluation_cli_keeps_platform_line_endings(
+    tmp_path: Path,
+    capsysbinary: pytest.CaptureFixture[bytes],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(qa_evaluation, "_NEWLINE", "\r\n")
+    output = tmp_path / "qa-eval.json"
+    qa_evaluation.main(["--output", str(output)])
+    artifact = output.read_bytes()
+    assert artifact.endswith(b"}\r\n")
+    assert b"\n" not in artifact.replace(b"\r\n", b"")
+    assert capsysbinary.readouterr().out == artifact
+
+
 def test_blueprint_cli_validates_and_rewrites_json(tmp_path: Path) -> None:
     path = tmp_path / "blueprint.json"
     raw = StoryBlueprint(
@@ -53,6 +53,24 @@ def test_qa_evaluation_harness_fails_on_alignment_regression(tmp_path: Path) ->
         run_evaluation(fixtures_path=mutated, output_path=output, strict=True)
 
 
+def test_qa_evaluation_fail_fast_skips_cases_after_first_failure(tmp_path: Path) -> None:
+    mutated = tmp_path / "fixtures.json"
+    payload = json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))
+    payload["cases"][0]["expectations"]["min_alignment_mean"] = 1.01
+    mutated.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    output = tmp_path / "evaluation-summary.json"
+    summary = run_evaluation(
+        fixtures_path=mutated, output_path=output, strict=False, fail_fast=True
+    )
+    totals = cast(dict[str, int], summary["totals"])
+    assert summary["status"] == "failed"
+    assert totals["cases"] == 1
+    assert totals["skipped"] == len(payload["cases"]) - 1
+    with pytest.raises(SystemExit):
+        run_evaluation(fixtures_path=mutated, output_path=output, strict=True, fail_fast=True)
+
+
 def test_fixture_loader_rejects_missing_cases(tmp_path: Path) -> None:
     broken = tmp_path / "broken.json"
     broken.write_text(
@@ -60,3 +78,17 @@ def test_fixture_loader_rejects_missing_cases(tmp_path: Path) -> None:
     )
     with pytest.raises(ValueError):
         load_fixture_suite(broken)
+
+
+def test_fixture_loader_reuses_parsed_suite_until_file_changes(tmp_path: Path) -> None:
+    fixture = tmp_path / "fixtures.json"
+    payload = json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))
+    fixture.write_text(json.dumps(payload), encoding="utf-8")
+    first = load_fixture_suite(fixture)
+    assert load_fixture_suite(fixture) is first
+
+    payload["cases"] = payload["cases"][:1]
+    fixture.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    reloaded = load_fixture_suite(fixture)
+    assert reloaded is not first
+    assert len(reloaded.cases) == 1
@@ -71,6 +71,24 @@ def test_parse_episode_page_extracts_title_body_and_total_hint() -> None:
     assert total_hint == 761
 
 
+def test_parse_episode_page_ignores_markup_outside_novel_sections() -> None:
+    html = """
+    <html>
+      <head><title>Site</title><script>var p = "<p>noise</p>";</script></head>
+      <body>
+        <nav><h1>Site Header</h1><p>Menu</p></nav>
+        <h1 class="p-novel__title">Episode Title</h1>
+        <div class="p-ad"><p>Advert</p></div>
+        <div class="js-novel-text p-novel__text"><p>Line 1</p></div>
+      </body>
+    </html>
+    """
+    title, body, total_hint = parse_episode_page(html)
+    assert title == "Episode Title"
+    assert body == "Line 1"
+    assert total_hint is None
+
+
 def test_chunk_text_splits_long_text() -> None:
     text = "a" * 10 + "\n\n" + "b" * 10 + "\n\n" + "c" * 10
     chunks = _chunk_text(text, max_chars=15)
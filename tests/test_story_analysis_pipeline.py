@@ -3,7 +3,12 @@ from __future__ import annotations
 from dataclasses import asdict
 
 from story_gen.core.dashboard_views import (
+    _draw_circle_stroke,
+    _draw_filled_circle,
+    _draw_line,
     export_graph_png,
+    export_graph_svg,
+    export_graph_svg_length,
     export_theme_heatmap_png,
     export_theme_heatmap_svg,
     export_timeline_png,
@@ -123,6 +128,86 @@ def test_pipeline_graph_png_export_is_deterministic() -> None:
     assert first == second
 
 
+def test_circle_rasterizers_match_distance_definition_with_clipping() -> None:
+    width, height, radius, stroke = 40, 30, 9, 3
+    for center in [(20, 15), (2, 3), (38, 28), (-5, 15)]:
+        filled = bytearray(width * height * 4)
+        ring = bytearray(width * height * 4)
+        _draw_filled_circle(
+            canvas=filled, width=width, height=height, center=center, radius=radius, color=(1,) * 4
+        )
+        _draw_circle_stroke(
+            canvas=ring,
+            width=width,
+            height=height,
+            center=center,
+            radius=radius,
+            stroke_width=stroke,
+            color=(1,) * 4,
+        )
+        for y in range(height):
+            for x in range(width):
+                distance_sq = (x - center[0]) ** 2 + (y - center[1]) ** 2
+                offset = (y * width + x) * 4
+                assert filled[offset] == (distance_sq <= radius**2)
+                assert ring[offset] == ((radius - stroke) ** 2 <= distance_sq <= radius**2)
+
+
+def test_line_rasterizer_matches_stamped_bresenham_path() -> None:
+    width, height = 30, 24
+    segments = [((3, 4), (25, 19)), ((25, 2), (4, 20)), ((-4, 10), (40, 12)), ((7, 28), (9, -3))]
+    segments += [((12, 12), (12, 12)), ((0, 0), (29, 0)), ((5, 23), (5, 0))]
+    for start, end in segments:
+        for thickness in (1, 2, 3, 5):
+            canvas = bytearray(width * height * 4)
+            _draw_line(
+                canvas=canvas,
+                width=width,
+                height=height,
+                start=start,
+                end=end,
+                color=(1,) * 4,
+                thickness=thickness,
+            )
+            expected: set[tuple[int, int]] = set()
+            x, y = start
+            dx, dy = abs(end[0] - x), abs(end[1] - y)
+            sx, sy = (1 if x < end[0] else -1), (1 if y < end[1] else -1)
+            err, radius = dx - dy, thickness // 2
+            while True:
+                expected.update(
+                    (x + ox, y + oy)
+                    for oy in range(-radius, radius + 1)
+                    for ox in range(-radius, radius + 1)
+                )
+                if (x, y) == end:
+                    break
+                twice = err * 2
+                if twice > -dy:
+                    err, x = err - dy, x + sx
+                if twice < dx:
+                    err, y = err + dx, y + sy
+            painted = {
+                (px, py)
+                for py in range(height)
+                for px in range(width)
+                if canvas[(py * width + px) * 4]
+            }
+            assert painted == {
+                (px, py) for px, py in expected if 0 <= px < width and 0 <= py < height
+            }
+
+
+def test_pipeline_graph_svg_length_matches_rendered_svg() -> None:
+    result = run_story_analysis(story_id="story-layout-svg", source_text=_sample_story())
+    nodes = result.dashboard.graph_nodes
+    edges = result.dashboard.graph_edges
+    assert export_graph_svg_length(nodes=nodes, edges=edges) == len(
+        export_graph_svg(nodes=nodes, edges=edges)
+    )
+    assert export_graph_svg_length(nodes=[], edges=[]) == len(export_graph_svg(nodes=[], edges=[]))
+
+
 def test_pipeline_timeline_and_heatmap_exports_are_deterministic() -> None:
     result = run_story_analysis(story_id="story-layout-views", source_text=_sample_story())
     timeline_svg_first = export_timeline_svg(lanes=result.dashboard.timeline_lanes)
@@ -180,6 +265,18 @@ def test_pipeline_preserves_dashboard_heatmap_and_arc_shapes() -> None:
     assert set(arc_payload) == {"lane", "stage", "value", "label"}
 
 
+def test_dashboard_to_dict_matches_asdict_without_aliasing() -> None:
+    result = run_story_analysis(story_id="story-to-dict", source_text=_sample_story())
+    payload = result.dashboard.to_dict()
+    assert payload == asdict(result.dashboard)
+    lanes = payload["timeline_lanes"]
+    assert isinstance(lanes, list)
+    lanes[0]["items"][0]["discrepancy_flags"].append("mutated")
+    original_flags = result.dashboard.timeline_lanes[0].items[0]["discrepancy_flags"]
+    assert isinstance(original_flags, list)
+    assert "mutated" not in original_flags
+
+
 def test_pipeline_drilldown_includes_theme_arc_conflict_and_emotion() -> None:
     result = run_story_analysis(story_id="story-drilldown", source_text=_sample_story())
     drilldown_items = result.dashboard.drilldown.values()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Literal
@@ -7,10 +8,20 @@ from typing import Literal
 import pytest
 
 from story_gen.cli.story_collector import (
+    ChapterLink,
+    CollectedChapter,
+    CollectionPayload,
     StoryCollectorArgs,
     _args_from_namespace,
+    _async_client,
+    _ChapterStreamWriter,
+    _client_headers,
+    _CrawlPacer,
+    _encode_collection_payload,
     _index_page_url,
+    _sync_client,
     collect_chapter_links,
+    collect_chapters,
     run_story_collection,
 )
 
@@ -38,6 +49,33 @@ class _FakeClient:
         return _FakeResponse(self.get_map[url])
 
 
+def test_collector_clients_do_not_share_mutable_headers() -> None:
+    args = StoryCollectorArgs(
+        base_url="https://example.com",
+        series_code="n1234ab",
+        output_dir="work/story_collector",
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=0.0,
+        max_workers=2,
+        timeout_seconds=5.0,
+        user_agent="story-gen-test/1.0",
+    )
+    first_headers = _client_headers(args.user_agent)
+    first_headers["User-Agent"] = "mutated"
+    assert _client_headers(args.user_agent)["User-Agent"] == "story-gen-test/1.0"
+
+    with _sync_client(args) as first, _sync_client(args) as second:
+        assert first.headers is not second.headers
+        first.headers["User-Agent"] = "mutated"
+        assert second.headers["User-Agent"] == "story-gen-test/1.0"
+    async_client = _async_client(args)
+    assert async_client.headers["User-Agent"] == "story-gen-test/1.0"
+    asyncio.run(async_client.aclose())
+
+
 def test_index_page_url_formats_page_query() -> None:
     assert (
         _index_page_url("https://ncode.syosetu.com", "n1234ab", 1)
@@ -118,6 +156,7 @@ def test_args_from_namespace_normalizes_ranges() -> None:
     namespace.max_workers = 0
     namespace.timeout_seconds = 0
     namespace.user_agent = "ua"
+    namespace.resume = False
 
     args = _args_from_namespace(namespace)
     assert args.series_code == "n1234ab"
@@ -169,3 +208,471 @@ def test_collect_chapter_links_honors_range_and_limit(
     links = collect_chapter_links(args)
     assert [link.number for link in links] == [2]
     assert links[0].title == "Episode Two"
+
+
+class _FakeAsyncClient:
+    def __init__(self, get_map: dict[str, str]) -> None:
+        self.get_map = get_map
+        self.calls: list[str] = []
+
+    async def __aenter__(self) -> "_FakeAsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, tb: object) -> Literal[False]:
+        return False
+
+    async def get(self, url: str) -> _FakeResponse:
+        self.calls.append(url)
+        if url not in self.get_map:
+            raise AssertionError(f"Unexpected URL: {url}")
+        return _FakeResponse(self.get_map[url])
+
+
+def test_collect_chapters_parallel_uses_one_async_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://example.com"
+    series = "n1234ab"
+    chapter_html = """
+    <html><body>
+      <h1 class="p-novel__title">Chapter</h1>
+      <div class="js-novel-text p-novel__text"><p>Body.</p></div>
+    </body></html>
+    """
+    links = [
+        ChapterLink(number=number, title=f"Ep {number}", url=f"{base_url}/{series}/{number}/")
+        for number in (3, 1, 2)
+    ]
+    fake_client = _FakeAsyncClient({link.url: chapter_html for link in links})
+    constructed: list[dict[str, object]] = []
+
+    def _client_factory(**kwargs: object) -> _FakeAsyncClient:
+        constructed.append(kwargs)
+        return fake_client
+
+    monkeypatch.setattr("story_gen.cli.story_collector.httpx.AsyncClient", _client_factory)
+    args = StoryCollectorArgs(
+        base_url=base_url,
+        series_code=series,
+        output_dir="work/story_collector",
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=0.0,
+        max_workers=3,
+        timeout_seconds=30.0,
+        user_agent="test-agent",
+    )
+
+    chapters = collect_chapters(args, links)
+    assert [chapter.number for chapter in chapters] == [1, 2, 3]
+    assert len(constructed) == 1
+    assert sorted(fake_client.calls) == sorted(link.url for link in links)
+
+
+def test_chapter_stream_writer_orders_out_of_order_arrivals(tmp_path: Path) -> None:
+    links = [
+        ChapterLink(number=number, title=f"Ep {number}", url=f"https://example.com/{number}/")
+        for number in (1, 2, 3)
+    ]
+    writer = _ChapterStreamWriter(
+        output_root=tmp_path / "out", output_filename="full_story.txt", links=links
+    )
+    for number in (2, 3, 1):
+        writer.add(
+            CollectedChapter(
+                number=number, title=f"T{number}", url=links[number - 1].url, body=f"B{number}章"
+            )
+        )
+    writer.close()
+    result = writer.write_index(base_url="https://example.com", series_code="n1234ab")
+
+    full_story = result.full_story_path.read_text(encoding="utf-8")
+    assert full_story.index("B1") < full_story.index("B2") < full_story.index("B3")
+    assert (tmp_path / "out" / "chapters" / "0002.txt").read_text(encoding="utf-8") == "B2章"
+    index_payload = json.loads(result.index_path.read_text(encoding="utf-8"))
+    assert [chapter["number"] for chapter in index_payload["chapters"]] == [1, 2, 3]
+    assert index_payload["chapters"][0]["chars"] == 3
+    assert index_payload["chapters"][0]["bytes"] == 5
+    assert result.chapter_count == 3
+
+
+def test_chapter_stream_writer_keeps_platform_line_endings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("story_gen.cli.story_collector._NEWLINE", "\r\n")
+    links = [ChapterLink(number=1, title="Ep 1", url="https://example.com/1/")]
+    writer = _ChapterStreamWriter(
+        output_root=tmp_path / "out", output_filename="full_story.txt", links=links
+    )
+    writer.add(CollectedChapter(number=1, title="T1", url=links[0].url, body="Line one\nLine two"))
+    writer.close()
+    result = writer.write_index(base_url="https://example.com", series_code="n1234ab")
+
+    chapter_bytes = (tmp_path / "out" / "chapters" / "0001.txt").read_bytes()
+    assert chapter_bytes == b"Line one\r\nLine two"
+    assert result.full_story_path.read_bytes() == (
+        b"===== Chapter 1: T1 =====\r\n\r\nLine one\r\nLine two\r\n\r\n\r\n"
+    )
+    assert b"\r\n" in result.index_path.read_bytes()
+    index_payload = json.loads(result.index_path.read_text(encoding="utf-8"))
+    assert index_payload["chapters"][0]["chars"] == len("Line one\nLine two")
+    assert index_payload["chapters"][0]["bytes"] == len(chapter_bytes)
+
+
+def test_collect_chapter_links_fetches_remaining_index_pages_in_parallel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://example.com"
+    series = "n1234ab"
+
+    def _index_html(numbers: list[int], *, last_page: int | None = None) -> str:
+        pager = (
+            f'<a class="c-pager__item--last" href="/{series}/?p={last_page}">last</a>'
+            if last_page
+            else ""
+        )
+        items = "".join(
+            f'<div class="p-eplist__sublist"><a href="/{series}/{n}/" '
+            f'class="p-eplist__subtitle">Episode {n}</a></div>'
+            for n in numbers
+        )
+        return f'<html><body>{pager}<div class="p-eplist">{items}</div></body></html>'
+
+    sync_client = _FakeClient({f"{base_url}/{series}/": _index_html([1, 2], last_page=3)})
+    async_client = _FakeAsyncClient(
+        {
+            f"{base_url}/{series}/?p=2": _index_html([3, 4]),
+            f"{base_url}/{series}/?p=3": _index_html([5]),
+        }
+    )
+    monkeypatch.setattr("story_gen.cli.story_collector.httpx.Client", lambda **kwargs: sync_client)
+    monkeypatch.setattr(
+        "story_gen.cli.story_collector.httpx.AsyncClient", lambda **kwargs: async_client
+    )
+    monkeypatch.setattr(
+        "story_gen.cli.story_collector.time.sleep",
+        lambda _x: pytest.fail("parallel discovery should not sleep between pages"),
+    )
+    args = StoryCollectorArgs(
+        base_url=base_url,
+        series_code=series,
+        output_dir="work/story_collector",
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=1.0,
+        max_workers=2,
+        timeout_seconds=30.0,
+        user_agent="test-agent",
+    )
+
+    links = collect_chapter_links(args)
+    assert [link.number for link in links] == [1, 2, 3, 4, 5]
+    assert sorted(async_client.calls) == [f"{base_url}/{series}/?p=2", f"{base_url}/{series}/?p=3"]
+
+
+def test_story_collection_resume_reuses_downloaded_chapters(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://example.com"
+    series = "n1234ab"
+    index_html = f"""
+    <html><body>
+      <div class="p-eplist">
+        <div class="p-eplist__sublist">
+          <a href="/{series}/1/" class="p-eplist__subtitle">Episode One</a>
+        </div>
+        <div class="p-eplist__sublist">
+          <a href="/{series}/2/" class="p-eplist__subtitle">Episode Two</a>
+        </div>
+      </div>
+    </body></html>
+    """
+    chapter_html = """
+    <html><body>
+      <h1 class="p-novel__title">Chapter Two</h1>
+      <div class="js-novel-text p-novel__text"><p>Fresh body.</p></div>
+    </body></html>
+    """
+    output_root = tmp_path / "out" / series
+    (output_root / "chapters").mkdir(parents=True)
+    (output_root / "chapters" / "0001.txt").write_text("Saved body.", encoding="utf-8")
+    (output_root / "index.json").write_text(
+        json.dumps({"chapters": [{"number": 1, "title": "Chapter One"}]}), encoding="utf-8"
+    )
+    fake_client = _FakeClient(
+        {f"{base_url}/{series}/": index_html, f"{base_url}/{series}/2/": chapter_html}
+    )
+    monkeypatch.setattr("story_gen.cli.story_collector.httpx.Client", lambda **kwargs: fake_client)
+    monkeypatch.setattr("story_gen.cli.story_collector.time.sleep", lambda _x: None)
+
+    args = StoryCollectorArgs(
+        base_url=base_url,
+        series_code=series,
+        output_dir=str(tmp_path / "out"),
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=0.0,
+        max_workers=1,
+        timeout_seconds=30.0,
+        user_agent="test-agent",
+        resume=True,
+    )
+
+    result = run_story_collection(args)
+    assert f"{base_url}/{series}/1/" not in fake_client.calls
+    full_story = result.full_story_path.read_text(encoding="utf-8")
+    assert full_story.index("Chapter 1: Chapter One") < full_story.index("Saved body.")
+    assert full_story.index("Saved body.") < full_story.index("Fresh body.")
+    index_payload = json.loads(result.index_path.read_text(encoding="utf-8"))
+    assert [chapter["title"] for chapter in index_payload["chapters"]] == [
+        "Chapter One",
+        "Chapter Two",
+    ]
+
+
+def test_story_collection_resume_refetches_truncated_chapter(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://example.com"
+    series = "n1234ab"
+    index_html = f"""
+    <html><body>
+      <div class="p-eplist">
+        <div class="p-eplist__sublist">
+          <a href="/{series}/1/" class="p-eplist__subtitle">Episode One</a>
+        </div>
+      </div>
+    </body></html>
+    """
+    chapter_html = """
+    <html><body>
+      <h1 class="p-novel__title">Chapter One</h1>
+      <div class="js-novel-text p-novel__text"><p>Complete body.</p></div>
+    </body></html>
+    """
+    output_root = tmp_path / "out" / series
+    (output_root / "chapters").mkdir(parents=True)
+    # An interrupted write left only the first bytes of the chapter behind.
+    (output_root / "chapters" / "0001.txt").write_bytes(b"Compl")
+    (output_root / "index.json").write_text(
+        json.dumps({"chapters": [{"number": 1, "title": "Chapter One", "bytes": 14}]}),
+        encoding="utf-8",
+    )
+    fake_client = _FakeClient(
+        {f"{base_url}/{series}/": index_html, f"{base_url}/{series}/1/": chapter_html}
+    )
+    monkeypatch.setattr("story_gen.cli.story_collector.httpx.Client", lambda **kwargs: fake_client)
+    monkeypatch.setattr("story_gen.cli.story_collector.time.sleep", lambda _x: None)
+
+    args = StoryCollectorArgs(
+        base_url=base_url,
+        series_code=series,
+        output_dir=str(tmp_path / "out"),
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=0.0,
+        max_workers=1,
+        timeout_seconds=30.0,
+        user_agent="test-agent",
+        resume=True,
+    )
+
+    result = run_story_collection(args)
+    assert f"{base_url}/{series}/1/" in fake_client.calls
+    assert (output_root / "chapters" / "0001.txt").read_text(encoding="utf-8") == "Complete body."
+    assert sorted(path.name for path in (output_root / "chapters").iterdir()) == ["0001.txt"]
+    assert "Complete body." in result.full_story_path.read_text(encoding="utf-8")
+
+
+def test_crawl_pacer_only_sleeps_for_remaining_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = iter([100.0, 100.4, 100.4, 103.0, 103.0])
+    slept: list[float] = []
+    monkeypatch.setattr("story_gen.cli.story_collector.time.monotonic", lambda: next(clock))
+    monkeypatch.setattr("story_gen.cli.story_collector.time.sleep", slept.append)
+
+    pacer = _CrawlPacer(1.0)
+    pacer.wait()
+    pacer.wait()
+    pacer.wait()
+    assert slept == [pytest.approx(0.6)]
+
+
+def test_encode_collection_payload_matches_stdlib_indent_output() -> None:
+    payload: CollectionPayload = {
+        "base_url": "https://example.com",
+        "series_code": "n1234ab",
+        "fetched_at_utc": "2024-01-01T00:00:00+00:00",
+        "chapter_count": 2,
+        "output_file": 'out/"full"\\story.txt',
+        "chapters": [
+            {"number": 1, "title": '第1話 "序"\t', "url": "https://e/1/", "chars": 3, "bytes": 9},
+            {"number": 2, "title": "Two\u2028", "url": "https://e/2/", "chars": 0, "bytes": 0},
+        ],
+    }
+    expected = json.dumps(payload, ensure_ascii=False, indent=2)
+    assert _encode_collection_payload(payload) == expected
+    empty: CollectionPayload = {**payload, "chapter_count": 0, "chapters": []}
+    assert _encode_collection_payload(empty) == json.dumps(empty, ensure_ascii=False, indent=2)
+
+
+def test_story_collection_failure_keeps_previous_full_story(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://example.com"
+    series = "n1234ab"
+    index_html = f"""
+    <html><body>
+      <div class="p-eplist">
+        <div class="p-eplist__sublist">
+          <a href="/{series}/1/" class="p-eplist__subtitle">Episode One</a>
+        </div>
+      </div>
+    </body></html>
+    """
+    output_root = tmp_path / "out" / series
+    output_root.mkdir(parents=True)
+    (output_root / "full_story.txt").write_text("previous run", encoding="utf-8")
+    fake_client = _FakeClient({f"{base_url}/{series}/": index_html})
+    monkeypatch.setattr("story_gen.cli.story_collector.httpx.Client", lambda **kwargs: fake_client)
+
+    args = StoryCollectorArgs(
+        base_url=base_url,
+        series_code=series,
+        output_dir=str(tmp_path / "out"),
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=0.0,
+        max_workers=1,
+        timeout_seconds=30.0,
+        user_agent="test-agent",
+    )
+
+    with pytest.raises(AssertionError, match="Unexpected URL"):
+        run_story_collection(args)
+    assert (output_root / "full_story.txt").read_text(encoding="utf-8") == "previous run"
+    assert not (output_root / "full_story.txt.partial").exists()
+    assert not (output_root / "index.json").exists()
+
+
+def test_story_collection_failure_reraises_fetch_error_over_write_error(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://example.com"
+    series = "n1234ab"
+    index_html = f"""
+    <html><body>
+      <div class="p-eplist">
+        <div class="p-eplist__sublist">
+          <a href="/{series}/1/" class="p-eplist__subtitle">Episode One</a>
+        </div>
+        <div class="p-eplist__sublist">
+          <a href="/{series}/2/" class="p-eplist__subtitle">Episode Two</a>
+        </div>
+      </div>
+    </body></html>
+    """
+    chapter_html = """
+    <html><body>
+      <h1 class="p-novel__title">Chapter One</h1>
+      <div class="js-novel-text p-novel__text"><p>Body.</p></div>
+    </body></html>
+    """
+    output_root = tmp_path / "out" / series
+    fake_client = _FakeClient(
+        {f"{base_url}/{series}/": index_html, f"{base_url}/{series}/1/": chapter_html}
+    )
+    monkeypatch.setattr("story_gen.cli.story_collector.httpx.Client", lambda **kwargs: fake_client)
+    monkeypatch.setattr("story_gen.cli.story_collector.time.sleep", lambda _x: None)
+
+    def _failing_write(path: Path, data: bytes) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("story_gen.cli.story_collector._write_bytes_atomic", _failing_write)
+
+    args = StoryCollectorArgs(
+        base_url=base_url,
+        series_code=series,
+        output_dir=str(tmp_path / "out"),
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=0.0,
+        max_workers=1,
+        timeout_seconds=30.0,
+        user_agent="test-agent",
+    )
+
+    with pytest.raises(AssertionError, match="Unexpected URL"):
+        run_story_collection(args)
+    assert not (output_root / "full_story.txt.partial").exists()
+    assert not (output_root / "full_story.txt").exists()
+
+
+def test_story_collection_discards_partial_when_a_chapter_write_fails(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://example.com"
+    series = "n1234ab"
+    index_html = f"""
+    <html><body>
+      <div class="p-eplist">
+        <div class="p-eplist__sublist">
+          <a href="/{series}/1/" class="p-eplist__subtitle">Episode One</a>
+        </div>
+      </div>
+    </body></html>
+    """
+    chapter_html = """
+    <html><body>
+      <h1 class="p-novel__title">Chapter One</h1>
+      <div class="js-novel-text p-novel__text"><p>Body.</p></div>
+    </body></html>
+    """
+    output_root = tmp_path / "out" / series
+    fake_client = _FakeClient(
+        {f"{base_url}/{series}/": index_html, f"{base_url}/{series}/1/": chapter_html}
+    )
+    monkeypatch.setattr("story_gen.cli.story_collector.httpx.Client", lambda **kwargs: fake_client)
+    monkeypatch.setattr("story_gen.cli.story_collector.time.sleep", lambda _x: None)
+
+    def _failing_write(path: Path, data: bytes) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("story_gen.cli.story_collector._write_bytes_atomic", _failing_write)
+
+    args = StoryCollectorArgs(
+        base_url=base_url,
+        series_code=series,
+        output_dir=str(tmp_path / "out"),
+        output_filename="full_story.txt",
+        chapter_start=1,
+        chapter_end=None,
+        max_chapters=None,
+        crawl_delay_seconds=0.0,
+        max_workers=1,
+        timeout_seconds=30.0,
+        user_agent="test-agent",
+    )
+
+    with pytest.raises(OSError, match="disk full"):
+        run_story_collection(args)
+    assert not (output_root / "full_story.txt.partial").exists()
+    assert not (output_root / "full_story.txt").exists()
+    assert not (output_root / "index.json").exists()
@@ -154,6 +154,14 @@ def test_pipeline_contracts_reject_invalid_sequences() -> None:
         validate_beat_output([bad_beat])
 
 
+def test_pipeline_contracts_distinguish_unsorted_from_gapped_sequences() -> None:
+    validate_extraction_input([_sample_segment("seg_one", 1), _sample_segment("seg_two", 2)])
+    with pytest.raises(ValueError, match="sorted in ascending order"):
+        validate_extraction_input([_sample_segment("seg_two", 2), _sample_segment("seg_one", 1)])
+    with pytest.raises(ValueError, match="contiguous"):
+        validate_extraction_input([_sample_segment("seg_one", 1), _sample_segment("seg_three", 3)])
+
+
 def test_insight_contract_requires_positive_confidence() -> None:
     insight = Insight(
         insight_id="ins_one",